@@ -1,5 +1,5 @@
 """CPM (Constraint Programming Model) package for SmartTour."""
 
-from .model import TourOptimizer
+from .model import TourOptimizer, SolutionProgressCallback
 
-__all__ = ["TourOptimizer"] 
\ No newline at end of file
+__all__ = ["TourOptimizer", "SolutionProgressCallback"] 
\ No newline at end of file
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Script to preprocess the venue data for faster loading.
+
+This script parses the venue JSON files once and stores their crowd levels
+and opening hours as NumPy arrays. The optimization scripts memory-map these
+arrays instead of parsing the JSON files. A cache older than the venue data
+is ignored, so rerun this script after updating the data.
+
+Usage:
+    python -m src.cpm.build_venue_cache [--data DIR] [--cache DIR]
+
+Arguments:
+    --data DIR   Directory with the venue data (default: data)
+    --cache DIR  Directory to write the cache to (default: data_cache next
+                 to the data directory)
+"""
+
+import argparse
+from pathlib import Path
+from .data_loader import DataLoader
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Preprocess the venue data for faster loading"
+    )
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / "data",
+        help="Directory with the venue data (default: data)"
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="Directory to write the cache to (default: data_cache)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Build the venue data cache."""
+    args = parse_args()
+    cache_dir = DataLoader(args.data, cache_dir=args.cache).build_venue_cache()
+    print(f"Venue data cache written to {cache_dir.absolute()}")
+
+
+if __name__ == "__main__":
+    main()
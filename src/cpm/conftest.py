@@ -0,0 +1,28 @@
+"""Pytest configuration for the CPM tests.
+
+Tests that run several CP-SAT solves are marked slow, so they can be
+skipped with -m "not slow". With pytest-xdist they are also kept in one
+xdist group, so that running with -n auto --dist loadgroup sends them to
+the same worker, where they share the solves of the solutions_by_day
+fixture.
+"""
+
+import pytest
+
+
+def pytest_configure(config):
+    """Register the markers used by the CPM tests."""
+    config.addinivalue_line(
+        "markers", "slow: test runs several CP-SAT solves"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of a group on one worker"
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Mark the day-varying tests as slow and group them together."""
+    for item in items:
+        if "different_days" in item.name:
+            item.add_marker(pytest.mark.slow)
+            item.add_marker(pytest.mark.xdist_group("different_days"))
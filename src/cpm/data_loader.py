@@ -6,23 +6,213 @@ This module provides functions to load and validate venue data, including:
 - Travel times between venues by day and time
 """
 
-import json
 import csv
+import json
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, cast, Optional
+from types import ModuleType
+from typing import Dict, Iterator, List, Tuple, cast, Optional
+import numpy as np
 from .model import DayOfWeek, DAY_TO_INT
 
+# orjson is optional (see requirements-optional.txt), it parses the venue
+# files several times faster
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Marker for missing entries in the dense travel time array
+MISSING_TRAVEL_TIME = -1
+
+# Marker for missing entries in the dense crowd level array. Crowd levels
+# range from -2 to 2, so -1 cannot be used.
+MISSING_CROWD_LEVEL = int(np.iinfo(np.int8).min)
+
+# Half-hour slots from 9:00 AM to 11:30 PM, covering every time slot list
+# that starts at 9:00. Opening hours are cached for these slots.
+_CACHE_TIME_SLOTS = [
+    f"{hour:02d}:{minute:02d}" for hour in range(9, 24) for minute in (0, 30)
+]
+
+# Crowd level time keys by hour of the day, and the reverse lookup
+_HOUR_STRS = tuple(f"{hour:02d}:00" for hour in range(24))
+_HOUR_IDX = {time: hour for hour, time in enumerate(_HOUR_STRS)}
+
+
+def _read_json(path: Path) -> Dict:
+    """Read and parse a JSON file, with orjson when it is installed."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _time_to_minutes(time_str: str) -> int:
+    """Convert HH:MM time string to minutes since midnight."""
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+class TravelTimeMatrix(Mapping):
+    """Read-only dict view of a dense travel time array.
+    
+    Supports the lookups of the travel time dict, e.g.
+    travel_times[(from, to, time, day)], while the data stays in a single
+    small integer array.
+    
+    Attributes:
+        matrix: int8 or int16 array of shape (venues, venues, slots, days)
+        venue_idx: Dict mapping venue name to its index in matrix
+        slot_idx: Dict mapping time slot to its index in matrix
+        day_idx: Dict mapping day name to its index in matrix
+    """
+    
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        venue_idx: Dict[str, int],
+        slot_idx: Dict[str, int],
+        day_idx: Dict[DayOfWeek, int]
+    ):
+        """Initialize the view.
+        
+        Args:
+            matrix: Travel minutes, or MISSING_TRAVEL_TIME where unknown
+            venue_idx: Dict mapping venue name to its index in matrix
+            slot_idx: Dict mapping time slot to its index in matrix
+            day_idx: Dict mapping day name to its index in matrix
+        """
+        self.matrix = matrix
+        self.venue_idx = venue_idx
+        self.slot_idx = slot_idx
+        self.day_idx = day_idx
+    
+    def __getitem__(self, key: Tuple[str, str, str, DayOfWeek]) -> int:
+        from_venue, to_venue, time_slot, day = key
+        try:
+            minutes = self.matrix[
+                self.venue_idx[from_venue],
+                self.venue_idx[to_venue],
+                self.slot_idx[time_slot],
+                self.day_idx[day]
+            ]
+        except KeyError:
+            raise KeyError(key) from None
+        if minutes == MISSING_TRAVEL_TIME:
+            raise KeyError(key)
+        return int(minutes)
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, str, DayOfWeek]]:
+        venues = list(self.venue_idx)
+        slots = list(self.slot_idx)
+        days = list(self.day_idx)
+        known = np.nonzero(self.matrix != MISSING_TRAVEL_TIME)
+        for i, j, t, d in zip(*(idx.tolist() for idx in known)):
+            yield (venues[i], venues[j], slots[t], days[d])
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.matrix != MISSING_TRAVEL_TIME))
+
+
+class CrowdLevels(Mapping):
+    """Read-only dict view of a dense crowd level array.
+    
+    Supports the lookups of the crowd level dict, e.g.
+    crowd_levels[(venue, time, day)], while the data stays in a single
+    int8 array.
+    
+    Attributes:
+        levels: int8 array of shape (venues, days, 24) indexed by the hour
+            of the day
+        venue_idx: Dict mapping venue name to its index in levels
+        day_idx: Dict mapping day name to its index in levels
+    """
+    
+    def __init__(
+        self,
+        levels: np.ndarray,
+        venue_idx: Dict[str, int],
+        day_idx: Dict[DayOfWeek, int]
+    ):
+        """Initialize the view.
+        
+        Args:
+            levels: Crowd levels, or MISSING_CROWD_LEVEL where unknown
+            venue_idx: Dict mapping venue name to its index in levels
+            day_idx: Dict mapping day name to its index in levels
+        """
+        self.levels = levels
+        self.venue_idx = venue_idx
+        self.day_idx = day_idx
+    
+    def __getitem__(self, key: Tuple[str, str, DayOfWeek]) -> int:
+        venue, time, day = key
+        try:
+            level = self.levels[
+                self.venue_idx[venue], self.day_idx[day], _HOUR_IDX[time]
+            ]
+        except KeyError:
+            raise KeyError(key) from None
+        if level == MISSING_CROWD_LEVEL:
+            raise KeyError(key)
+        return int(level)
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, DayOfWeek]]:
+        venues = list(self.venue_idx)
+        days = list(self.day_idx)
+        known = np.nonzero(self.levels != MISSING_CROWD_LEVEL)
+        for v, d, h in zip(*(idx.tolist() for idx in known)):
+            yield (venues[v], _HOUR_STRS[h], days[d])
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.levels != MISSING_CROWD_LEVEL))
+
 
 class DataLoader:
-    """Loads and validates venue data for the tour optimizer."""
+    """Loads and validates venue data for the tour optimizer.
+    
+    After load_all() the travel times and crowd levels are also available
+    as dense arrays:
+    
+    Attributes:
+        tt_array: int8 (or int16 for travel times over 127 minutes) array
+            of shape (venues, venues, slots, days) holding travel minutes,
+            or MISSING_TRAVEL_TIME where no data exists
+        venue_idx: Dict mapping venue name to its index in tt_array
+        slot_idx: Dict mapping time slot to its index in tt_array
+        day_idx: Dict mapping day name to its index in tt_array
+        open_mask: bool array of shape (venues, days, slots), True where
+            the venue is open, indexed like tt_array
+        crowd_array: int8 array of shape (venues, days, 24) holding crowd
+            levels by hour of the day, or MISSING_CROWD_LEVEL where no data
+            exists, indexed like tt_array
+    """
     
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, cache_dir: Optional[Path] = None):
         """Initialize the data loader.
         
         Args:
             data_dir: Path to directory containing data files
+            cache_dir: Path to the preprocessed venue data written by
+                build_venue_cache() (default: data_cache next to data_dir)
         """
         self.data_dir = data_dir
+        self.cache_dir = (
+            cache_dir if cache_dir is not None
+            else data_dir.parent / "data_cache"
+        )
+        self.tt_array: Optional[np.ndarray] = None
+        self.venue_idx: Dict[str, int] = {}
+        self.slot_idx: Dict[str, int] = {}
+        self.day_idx: Dict[DayOfWeek, int] = {}
+        self.open_mask: Optional[np.ndarray] = None
+        self.crowd_array: Optional[np.ndarray] = None
     
     def load_venue_data(self) -> Dict[str, Dict]:
         """Load venue data from JSON files.
@@ -35,14 +225,16 @@ class DataLoader:
             JSONDecodeError: If venue data files are invalid JSON
         """
         venues = {}
-        for json_file in self.data_dir.glob("*.json"):
-            if json_file.stem == "all_attractions":
-                continue
-            
-            # Load the JSON data
-            with open(json_file) as f:
-                venue_data = json.load(f)
-            
+        json_files = [
+            json_file for json_file in self.data_dir.glob("*.json")
+            if json_file.stem != "all_attractions"
+        ]
+        
+        # Load the JSON data, overlapping the file reads with parsing
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parsed = list(executor.map(_read_json, json_files))
+        
+        for json_file, venue_data in zip(json_files, parsed):
             # Use the actual venue name from the JSON data if available
             if "venue_info" in venue_data and "venue_name" in venue_data["venue_info"]:
                 venue_name = venue_data["venue_info"]["venue_name"]
@@ -52,7 +244,7 @@ class DataLoader:
                 if venue_name == "Cn Tower":
                     venue_name = "CN Tower"
             
-            venues[venue_name] = venue_data
+            venues[sys.intern(venue_name)] = venue_data
         return venues
     
     def load_dwell_times(self) -> Dict[str, float]:
@@ -65,13 +257,34 @@ class DataLoader:
             FileNotFoundError: If dwell times file not found
             ValueError: If dwell times are invalid
         """
-        dwell_times = {}
         dwell_times_file = self.data_dir / "venue_dwell_times.csv"
-        with open(dwell_times_file) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                dwell_times[row["Venue"]] = float(row["Dwell Time (hours)"])
-        return dwell_times
+        with open(dwell_times_file, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            venue_col = header.index("Venue")
+            dwell_col = header.index("Dwell Time (hours)")
+            return {
+                sys.intern(row[venue_col]): float(row[dwell_col])
+                for row in reader
+            }
+    
+    def list_venues(self) -> List[str]:
+        """List the venues to plan tours for, without loading their data.
+        
+        Only reads the dwell times file, which defines the venues used by
+        load_all().
+        
+        Returns:
+            List of venue names, in the order of load_dwell_times()
+        
+        Raises:
+            FileNotFoundError: If dwell times file not found
+        """
+        dwell_times_file = self.data_dir / "venue_dwell_times.csv"
+        with open(dwell_times_file, newline="") as f:
+            reader = csv.reader(f)
+            venue_col = next(reader).index("Venue")
+            return [sys.intern(row[venue_col]) for row in reader]
     
     def load_travel_times(
         self,
@@ -97,32 +310,32 @@ class DataLoader:
             if target in available_times:
                 return target
             # Convert all times to minutes since midnight
-            target_mins = int(target.split(":")[0]) * 60 + \
-                         int(target.split(":")[1])
-            time_mins = [(t, int(t.split(":")[0]) * 60 + \
-                         int(t.split(":")[1])) for t in available_times]
+            target_mins = _time_to_minutes(target)
+            time_mins = [(t, _time_to_minutes(t)) for t in available_times]
             # Find closest time by absolute difference
             closest = min(time_mins, key=lambda x: abs(x[1] - target_mins))
             return closest[0]
         
-        # First pass: collect available times for each venue pair
+        # Collect available times and base travel times for each venue pair
+        # in a single pass, looking up the columns by position
         available_times: Dict[Tuple[str, str], List[str]] = {}
-        with open(travel_times_file) as f:
-            reader = csv.DictReader(f)
+        base_times = {}  # Store base travel times
+        with open(travel_times_file, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            from_col = header.index("From")
+            to_col = header.index("To")
+            time_col = header.index("Time")
+            minutes_col = header.index("Travel Time (min)")
             for row in reader:
-                venue_pair = (row["From"], row["To"])
-                if venue_pair not in available_times:
-                    available_times[venue_pair] = []
-                available_times[venue_pair].append(row["Time"])
-        
-        # Second pass: load times and fill in missing slots
-        with open(travel_times_file) as f:
-            reader = csv.DictReader(f)
-            base_times = {}  # Store base travel times
-            for row in reader:
-                venue_pair = (row["From"], row["To"])
-                base_times[(venue_pair, row["Time"])] = \
-                    int(float(row["Travel Time (min)"]))
+                # Intern the labels, so the keys share one string object
+                # per venue and time with the other loaded tables
+                venue_pair = (
+                    sys.intern(row[from_col]), sys.intern(row[to_col])
+                )
+                time = sys.intern(row[time_col])
+                available_times.setdefault(venue_pair, []).append(time)
+                base_times[(venue_pair, time)] = int(float(row[minutes_col]))
         
         # Fill in all time slots for each venue pair
         for venue_pair, avail_times in available_times.items():
@@ -137,6 +350,188 @@ class DataLoader:
         
         return times
     
+    def load_travel_times_matrix(
+        self,
+        time_slots: List[str]
+    ) -> Tuple[
+        np.ndarray,
+        Dict[str, int],
+        Dict[str, int],
+        Dict[DayOfWeek, int]
+    ]:
+        """Load travel times between venues as a dense array.
+        
+        Only venues from list_venues() are included. Wrap the result in
+        TravelTimeMatrix for dict style lookups.
+        
+        Args:
+            time_slots: List of time slots in HH:MM format
+        
+        Returns:
+            Tuple containing:
+            - matrix: int8 or int16 array of shape
+              (venues, venues, slots, days)
+            - venue_idx: Dict mapping venue name to its index in matrix
+            - slot_idx: Dict mapping time slot to its index in matrix
+            - day_idx: Dict mapping day name to its index in matrix
+        
+        Raises:
+            FileNotFoundError: If dwell times or travel times file not found
+        """
+        venues = self.list_venues()
+        known = set(venues)
+        travel_times = {
+            key: minutes
+            for key, minutes in self.load_travel_times(time_slots).items()
+            if key[0] in known and key[1] in known
+        }
+        matrix = self.build_travel_time_array(travel_times, venues, time_slots)
+        return matrix, self.venue_idx, self.slot_idx, self.day_idx
+    
+    def build_travel_time_array(
+        self,
+        travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
+        venues: List[str],
+        time_slots: List[str]
+    ) -> np.ndarray:
+        """Build a dense travel time array and its index maps.
+        
+        Also stores the array and index maps on the loader as tt_array,
+        venue_idx, slot_idx and day_idx. The array is int8 when all travel
+        times fit, which they do for trips within a city.
+        
+        Args:
+            travel_times: Dict mapping (from,to,time,day) to travel time
+            venues: List of venue names
+            time_slots: List of time slots in HH:MM format
+        
+        Returns:
+            int8 or int16 array of shape (venues, venues, slots, days) with
+            MISSING_TRAVEL_TIME where no travel time is known
+        """
+        self.venue_idx = {venue: i for i, venue in enumerate(venues)}
+        self.slot_idx = {slot: i for i, slot in enumerate(time_slots)}
+        self.day_idx = dict(DAY_TO_INT)
+        
+        tt = np.full(
+            (len(venues), len(venues), len(time_slots), len(DAY_TO_INT)),
+            MISSING_TRAVEL_TIME,
+            dtype=np.int16
+        )
+        for (from_venue, to_venue, time_slot, day), minutes in travel_times.items():
+            tt[
+                self.venue_idx[from_venue],
+                self.venue_idx[to_venue],
+                self.slot_idx[time_slot],
+                self.day_idx[day]
+            ] = minutes
+        
+        # Halve the array size when the travel times allow it. Cast to a
+        # wider type before doing arithmetic on the travel times.
+        if tt.max(initial=MISSING_TRAVEL_TIME) <= np.iinfo(np.int8).max:
+            tt = tt.astype(np.int8)
+        
+        self.tt_array = tt
+        return tt
+    
+    def build_open_mask(
+        self,
+        operating_hours: Dict[Tuple[str, DayOfWeek], List[int]],
+        venues: List[str],
+        time_slots: List[str]
+    ) -> np.ndarray:
+        """Build a boolean mask of open time slots.
+        
+        Also stores the mask on the loader as open_mask.
+        
+        Args:
+            operating_hours: Dict mapping (venue, day) to valid slot indices
+            venues: List of venue names
+            time_slots: List of time slots in HH:MM format
+        
+        Returns:
+            bool array of shape (venues, days, slots), True where open
+        """
+        mask = np.zeros(
+            (len(venues), len(DAY_TO_INT), len(time_slots)),
+            dtype=np.bool_
+        )
+        for i, venue in enumerate(venues):
+            for day_name, d in DAY_TO_INT.items():
+                mask[i, d, operating_hours.get((venue, day_name), [])] = True
+        
+        self.open_mask = mask
+        return mask
+    
+    def build_crowd_array(
+        self,
+        venue_data: Dict[str, Dict],
+        venues: List[str]
+    ) -> np.ndarray:
+        """Build a dense array of crowd levels.
+        
+        Holds the same levels as extract_crowd_levels(), with "closed"
+        (999) stored as 0.
+        
+        Args:
+            venue_data: Dict mapping venue name to venue data
+            venues: List of venue names, giving the order of the first axis
+        
+        Returns:
+            int8 array of shape (venues, days, 24) indexed by the hour of
+            the day, with MISSING_CROWD_LEVEL where no level is known
+        """
+        # Collect the raw intensities first, then clean them in one pass
+        raw = np.full(
+            (len(venues), len(DAY_TO_INT), len(_HOUR_STRS)),
+            MISSING_CROWD_LEVEL,
+            dtype=np.int16
+        )
+        for i, venue in enumerate(venues):
+            for day_data in venue_data[venue]["analysis"]:
+                hour_analysis = day_data["hour_analysis"]
+                hours = np.fromiter(
+                    (hour_data["hour"] for hour_data in hour_analysis),
+                    dtype=np.intp,
+                    count=len(hour_analysis)
+                )
+                raw[i, day_data["day_info"]["day_int"], hours] = np.fromiter(
+                    (hour_data["intensity_nr"] for hour_data in hour_analysis),
+                    dtype=np.int16,
+                    count=len(hour_analysis)
+                )
+        
+        return np.where(raw == 999, 0, raw).astype(np.int8)
+    
+    def build_crowd_level_array(
+        self,
+        crowd_levels: Dict[Tuple[str, str, DayOfWeek], int],
+        venues: List[str]
+    ) -> np.ndarray:
+        """Build a dense array from the crowd level dict.
+        
+        Wrap it in CrowdLevels for dict style lookups.
+        
+        Args:
+            crowd_levels: Dict mapping (venue, time_slot, day) to crowd
+                level, as returned by extract_crowd_levels()
+            venues: List of venue names, giving the order of the first axis
+        
+        Returns:
+            int8 array of shape (venues, days, 24) indexed by the hour of
+            the day, with MISSING_CROWD_LEVEL where no level is known
+        """
+        venue_idx = {venue: i for i, venue in enumerate(venues)}
+        levels = np.full(
+            (len(venues), len(DAY_TO_INT), len(_HOUR_STRS)),
+            MISSING_CROWD_LEVEL,
+            dtype=np.int8
+        )
+        for (venue, time, day), level in crowd_levels.items():
+            levels[venue_idx[venue], DAY_TO_INT[day], _HOUR_IDX[time]] = level
+        
+        return levels
+    
     def extract_crowd_levels(
         self,
         venue_data: Dict[str, Dict]
@@ -149,21 +544,24 @@ class DataLoader:
         Returns:
             Dict mapping (venue, time_slot, day) to crowd level
         """
-        levels: Dict[Tuple[str, str, DayOfWeek], int] = {}
+        keys: List[Tuple[str, str, DayOfWeek]] = []
+        intensities: List[int] = []
+        day_names = list(DAY_TO_INT.keys())
         
         for venue_name, data in venue_data.items():
             for day_data in data["analysis"]:
                 day_int = day_data["day_info"]["day_int"]
-                day_name = list(DAY_TO_INT.keys())[day_int]
-                day = cast(DayOfWeek, day_name)
+                day = cast(DayOfWeek, day_names[day_int])
                 
                 for hour_data in day_data["hour_analysis"]:
-                    time = f"{hour_data['hour']:02d}:00"
-                    levels[(venue_name, time, day)] = (
-                        0 if hour_data["intensity_nr"] == 999 
-                        else hour_data["intensity_nr"]
-                    )
-        return levels
+                    time = _HOUR_STRS[hour_data["hour"]]
+                    keys.append((venue_name, time, day))
+                    intensities.append(hour_data["intensity_nr"])
+        
+        # Treat closed hours (999) as average crowds, in one pass
+        raw = np.array(intensities, dtype=np.int16)
+        levels = np.where(raw == 999, 0, raw)
+        return dict(zip(keys, levels.tolist()))
     
     def extract_operating_hours(
         self,
@@ -274,11 +672,80 @@ class DataLoader:
         
         return slots
     
+    def build_venue_cache(self) -> Path:
+        """Preprocess the venue JSON files into NumPy arrays.
+        
+        Writes to cache_dir:
+        - venues.txt: Venue names, one per line, in array order
+        - intensity.npy: int8 crowd levels from build_crowd_array()
+        - open_slots.npy: bool array of shape (venues, days, 30), True
+          where the venue is open in the half-hour slot from 9:00 AM
+        
+        Returns:
+            Path to the cache directory
+        """
+        venue_data = self.load_venue_data()
+        venues = list(venue_data)
+        intensity = self.build_crowd_array(venue_data, venues)
+        operating_hours = self.extract_operating_hours(
+            venue_data, _CACHE_TIME_SLOTS
+        )
+        open_slots = np.zeros(
+            (len(venues), len(DAY_TO_INT), len(_CACHE_TIME_SLOTS)),
+            dtype=np.bool_
+        )
+        for i, venue in enumerate(venues):
+            for day_name, d in DAY_TO_INT.items():
+                slots = operating_hours.get((venue, day_name), [])
+                open_slots[i, d, slots] = True
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.save(self.cache_dir / "intensity.npy", intensity)
+        np.save(self.cache_dir / "open_slots.npy", open_slots)
+        (self.cache_dir / "venues.txt").write_text(
+            "".join(f"{venue}\n" for venue in venues)
+        )
+        return self.cache_dir
+    
+    def load_venue_cache(
+        self
+    ) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """Load the venue data written by build_venue_cache().
+        
+        The arrays are memory-mapped. A cache older than any venue JSON
+        file is ignored.
+        
+        Returns:
+            Tuple of (venues, intensity, open_slots), or None if there is no
+            up to date cache
+        """
+        cache_files = [
+            self.cache_dir / name
+            for name in ("venues.txt", "intensity.npy", "open_slots.npy")
+        ]
+        if not all(path.exists() for path in cache_files):
+            return None
+        data_mtime = max(
+            (path.stat().st_mtime for path in self.data_dir.glob("*.json")),
+            default=0.0
+        )
+        if min(path.stat().st_mtime for path in cache_files) < data_mtime:
+            return None
+        
+        venues = [
+            sys.intern(venue)
+            for venue in cache_files[0].read_text().splitlines()
+        ]
+        intensity = np.load(cache_files[1], mmap_mode="r")
+        open_slots = np.load(cache_files[2], mmap_mode="r")
+        return venues, intensity, open_slots
+    
     def load_all(
         self,
-        time_slots: List[str]
+        time_slots: List[str],
+        use_cache: bool = False
     ) -> Tuple[
-        Dict[str, Dict],
+        Optional[Dict[str, Dict]],
         Dict[str, float],
         Dict[Tuple[str, str, str, DayOfWeek], int],
         Dict[Tuple[str, str, DayOfWeek], int],
@@ -288,10 +755,13 @@ class DataLoader:
         
         Args:
             time_slots: List of time slots in HH:MM format
+            use_cache: Take crowd levels and opening hours from an up to date
+                cache written by build_venue_cache() instead of parsing the
+                venue JSON files. The raw venue data is then not loaded.
         
         Returns:
             Tuple containing:
-            - venue_data: Raw venue data
+            - venue_data: Raw venue data, or None if loaded from the cache
             - dwell_times: Venue dwell times
             - travel_times: Travel times between venues
             - crowd_levels: Crowd levels by venue, time and day
@@ -300,15 +770,42 @@ class DataLoader:
         # First load dwell times to know which venues to include
         dwell_times = self.load_dwell_times()
         
-        # Then load venue data and filter to only include venues with dwell times
-        all_venue_data = self.load_venue_data()
-        venue_data = {name: data for name, data in all_venue_data.items() 
-                     if name in dwell_times}
+        cache = None
+        if use_cache and len(time_slots) <= len(_CACHE_TIME_SLOTS):
+            cache = self.load_venue_cache()
+        
+        if cache is not None:
+            # Rebuild the crowd levels and opening hours of venues with
+            # dwell times from the cached arrays
+            cached_venues, intensity, open_slots = cache
+            venue_data = None
+            rows = {
+                venue: i for i, venue in enumerate(cached_venues)
+                if venue in dwell_times
+            }
+            crowd_levels = dict(CrowdLevels(
+                np.asarray(intensity[list(rows.values())]),
+                {venue: i for i, venue in enumerate(rows)},
+                dict(DAY_TO_INT)
+            ))
+            operating_hours = {
+                (venue, cast(DayOfWeek, day_name)):
+                    np.flatnonzero(open_slots[i, d, :len(time_slots)]).tolist()
+                for venue, i in rows.items()
+                for day_name, d in DAY_TO_INT.items()
+            }
+        else:
+            # Load venue data and filter to only include venues with dwell times
+            all_venue_data = self.load_venue_data()
+            venue_data = {name: data for name, data in all_venue_data.items() 
+                         if name in dwell_times}
+            crowd_levels = self.extract_crowd_levels(venue_data)
+            operating_hours = self.extract_operating_hours(
+                venue_data, time_slots
+            )
         
         # Load remaining data
         travel_times = self.load_travel_times(time_slots)
-        crowd_levels = self.extract_crowd_levels(venue_data)
-        operating_hours = self.extract_operating_hours(venue_data, time_slots)
         
         # Filter travel times to only include venues with dwell times
         filtered_travel_times = {}
@@ -317,6 +814,17 @@ class DataLoader:
             if from_venue in dwell_times and to_venue in dwell_times:
                 filtered_travel_times[key] = value
         
+        # Keep a dense copy of the travel times for vectorized access
+        self.build_travel_time_array(
+            filtered_travel_times, list(dwell_times.keys()), time_slots
+        )
+        self.build_open_mask(
+            operating_hours, list(dwell_times.keys()), time_slots
+        )
+        self.crowd_array = self.build_crowd_level_array(
+            crowd_levels, list(dwell_times.keys())
+        )
+        
         return (
             venue_data,
             dwell_times,
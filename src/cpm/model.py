@@ -18,10 +18,14 @@ Constraints:
 The model uses 30-minute time slots and supports flexible tour start/end times.
 """
 
-from typing import Dict, List, Optional, Tuple
+from fractions import Fraction
+from typing import Dict, List, Mapping, Optional, Tuple
+import math
+import numbers
 from cpmpy import Model
 from cpmpy.expressions.variables import IntVar, BoolVar
 from cpmpy.solvers import CPM_ortools
+from ortools.sat.python import cp_model
 import logging
 
 # Set up logger
@@ -41,6 +45,54 @@ DAY_TO_INT = {
     "Sunday": 6
 }
 
+class SolutionProgressCallback(cp_model.CpSolverSolutionCallback):
+    """Records every improving solution found while CP-SAT is searching.
+    
+    Pass an instance to TourOptimizer.solve() to follow how the solution
+    improves over a single solve instead of re-solving with increasing
+    time limits.
+    
+    Attributes:
+        venues: List of venue names, in the optimizer's venue order
+        solutions: List of (wall_time, objective, selected_venues) tuples,
+            one per incumbent, with selected venues in visit order
+    """
+    
+    def __init__(self, venues: List[str]):
+        """Initialize the callback.
+        
+        Args:
+            venues: List of venue names, in the optimizer's venue order
+        """
+        super().__init__()
+        self.venues = venues
+        self.solutions: List[Tuple[float, float, List[str]]] = []
+        self._x_vars: List = []
+        self._p_vars: List = []
+    
+    def watch(self, x_vars: List, p_vars: List) -> None:
+        """Set the OR-Tools selection and position variables to report.
+        
+        Args:
+            x_vars: OR-Tools BoolVars for venue selection
+            p_vars: OR-Tools IntVars for visit positions
+        """
+        self._x_vars = x_vars
+        self._p_vars = p_vars
+    
+    def on_solution_callback(self):
+        """Record the wall time, objective and venues of the incumbent."""
+        selected = [
+            i for i, x in enumerate(self._x_vars) if self.Value(x)
+        ]
+        selected.sort(key=lambda i: self.Value(self._p_vars[i]))
+        self.solutions.append((
+            self.WallTime(),
+            self.ObjectiveValue(),
+            [self.venues[i] for i in selected]
+        ))
+
+
 class TourOptimizer:
     """Optimizes a day tour itinerary using constraint programming.
     
@@ -58,6 +110,11 @@ class TourOptimizer:
     systems. The number of cores to use can be specified when calling the
     solve() method.
     
+    Besides the CPMpy model, an equivalent model can be built directly with
+    the OR-Tools CP-SAT API (see _build_native_model()). The native path posts
+    the high-count constraint families (element, no-overlap, all-different)
+    without going through CPMpy's expression transformation.
+    
     Attributes:
         venues: List of venue names to consider
         n_venues: Number of venues
@@ -86,10 +143,10 @@ class TourOptimizer:
         venues: List[str],
         dwell_times: Dict[str, float],
         time_slots: List[str],  # ["10:00", "10:30", ...]
-        travel_times: Dict[
+        travel_times: Mapping[
             Tuple[str, str, str, DayOfWeek], int
         ],  # (from,to,time,day)->min
-        crowd_levels: Dict[
+        crowd_levels: Mapping[
             Tuple[str, str, DayOfWeek], int
         ],  # (venue,time,day)->level
         venue_open_slots: Optional[
@@ -132,6 +189,10 @@ class TourOptimizer:
         # Set minimum number of venues to visit (default: 1)
         self.min_venues = 1
         
+        # Start slots, positions and selections of the last solution found,
+        # used to warm start the next solve
+        self._solution_hint: Optional[Tuple[List[int], ...]] = None
+        
         # Convert dwell times from hours to number of 30-min slots
         self.dwell_slots = {}
         for venue, hours in dwell_times.items():
@@ -188,6 +249,9 @@ class TourOptimizer:
         # Clear existing constraints to avoid duplicates when updating
         self.model = Model()
         
+        # The native model has to be rebuilt with the new constraints
+        self._native_model = None
+        
         # Recreate variables since we reset the model
         self._create_variables()
         
@@ -460,7 +524,6 @@ class TourOptimizer:
         
         # 2. Calculate total crowd exposure during visits
         total_crowd_level = 0
-        max_crowd_level = 100  # Crowd levels are 0-100
         for i, venue in enumerate(self.venues):
             # For each selected venue
             if self.x[i]:
@@ -485,16 +548,23 @@ class TourOptimizer:
         # 3. Count number of venues visited (to maximize)
         n_visited = sum(self.x)
         
-        # Calculate maximum possible travel time for normalization
-        max_travel_time = max(
-            [time for time in self.travel_times.values()],
-            default=1  # Default to 1 if no travel times
-        )
+        # With integer weights, minimize the exact normalized objective
+        int_coefs = self._integer_objective_coefficients()
+        if int_coefs is not None:
+            self.model.minimize(sum(
+                c * term for c, term in zip(
+                    int_coefs,
+                    (total_travel_time, total_crowd_level, n_visited)
+                )
+            ))
+            return
         
-        # Normalize components (avoid division by zero)
-        normalized_travel = total_travel_time / max(1, max_travel_time)
-        normalized_crowd = total_crowd_level / max(1, max_crowd_level * self.n_venues * self.n_slots)
-        normalized_venues = n_visited / max(1, self.n_venues)
+        # Normalize components. CPMpy only supports integer division, so
+        # each normalized component is truncated toward zero.
+        travel_norm, crowd_norm, venues_norm = self._objective_norms()
+        normalized_travel = total_travel_time // travel_norm
+        normalized_crowd = total_crowd_level // crowd_norm
+        normalized_venues = n_visited // venues_norm
         
         # Combine objectives with weights
         objective = 0
@@ -503,14 +573,297 @@ class TourOptimizer:
         objective += self.w_venues * normalized_venues   # Maximize venues
         
         self.model.minimize(objective)
-    
-    def solve(self, num_cores: int = 4, time_limit: int = 300) -> Optional[Dict]:
-        """Solve the model and return the solution if found.
+
+    def _objective_norms(self) -> Tuple[int, int, int]:
+        """Get the divisors normalizing the objective components.
+        
+        Returns:
+            Tuple of (travel, crowd, venues) divisors, each at least 1
+        """
+        max_travel_time = max(self.travel_times.values(), default=1)
+        max_crowd_level = 100  # Crowd levels are 0-100
+        return (
+            max(1, max_travel_time),
+            max(1, max_crowd_level * self.n_venues * self.n_slots),
+            max(1, self.n_venues)
+        )
+
+    def _integer_objective_coefficients(self) -> Optional[List[int]]:
+        """Scale the normalized objective to exact integer coefficients.
         
+        CP-SAT works with integers only. With integer weights, the weighted
+        normalized terms are put on a common denominator, so the objective
+        is exact instead of truncating each term or letting the solver
+        approximate float coefficients.
+        
+        Returns:
+            Integer (travel, crowd, venues) coefficients of the raw objective
+            terms, or None if any weight is not an integer
+        """
+        weights = (self.w_travel, self.w_crowd, self.w_venues)
+        if not all(isinstance(w, numbers.Integral) for w in weights):
+            return None
+        
+        coefs = [
+            Fraction(int(w), norm)
+            for w, norm in zip(weights, self._objective_norms())
+        ]
+        denom = math.lcm(*(c.denominator for c in coefs))
+        int_coefs = [int(c * denom) for c in coefs]
+        divisor = math.gcd(*int_coefs) or 1
+        return [c // divisor for c in int_coefs]
+
+    def _build_native_model(self) -> cp_model.CpModel:
+        """Build the tour model directly with the OR-Tools CP-SAT API.
+
+        This mirrors the CPMpy model built by _add_constraints() and
+        _set_objective(), but posts the bulk constraint families natively:
+        - Allowed start slots as a single domain constraint per venue
+        - Travel times and crowd exposure via AddElement on the start slot
+        - Non-overlapping visits via optional intervals and AddNoOverlap
+        - Unique positions via a single AddAllDifferent
+
+        The native variables are stored in self._native_t, self._native_x
+        and self._native_p so the solution can be read back after solving.
+        The objective terms are stored in self._native_terms, and truncated
+        by their normalizing divisor like in the CPMpy objective in
+        self._native_truncated_terms, so that _set_native_objective() can
+        re-weight them without a rebuild.
+
+        Returns:
+            The CP-SAT model
+        """
+        model = cp_model.CpModel()
+        n = self.n_venues
+
+        t = [model.NewIntVar(0, self.n_slots - 1, f"start_time_{i}")
+             for i in range(n)]
+        p = [model.NewIntVar(0, n, f"position_{i}") for i in range(n)]
+        x = [model.NewBoolVar(f"venue_selected_{i}") for i in range(n)]
+
+        # Valid slots and latest valid slot per venue
+        valid = [
+            set(self.venue_open_slots.get((venue, self.day), []))
+            for venue in self.venues
+        ]
+        latest_valid = [max(v) if v else -1 for v in valid]
+        dwell = [self.dwell_slots[venue] for venue in self.venues]
+
+        # 1. Time windows: restrict start slots of selected venues
+        for i in range(n):
+            if not valid[i]:
+                model.Add(x[i] == 0)
+                continue
+
+            # The sequence constraints forbid ending past the last valid slot
+            # whenever another open venue could follow
+            has_successor = any(valid[j] for j in range(n) if j != i)
+            latest_start = min(self.tour_end_slot, latest_valid[i] - dwell[i] + 1)
+            if has_successor:
+                latest_start = min(latest_start, latest_valid[i] - dwell[i])
+
+            allowed = [
+                s for s in range(max(self.tour_start_slot, min(valid[i])),
+                                 latest_start + 1)
+                if all(slot in valid[i] for slot in range(s, s + dwell[i]))
+            ]
+            if allowed:
+                model.AddLinearExpressionInDomain(
+                    t[i], cp_model.Domain.FromValues(allowed)
+                ).OnlyEnforceIf(x[i])
+            else:
+                model.Add(x[i] == 0)
+
+        # 2. Positions: 1..n_selected for selected venues, 0 otherwise
+        n_selected = sum(x)
+        model.Add(n_selected >= self.min_venues)
+        for i in range(n):
+            model.Add(p[i] >= 1).OnlyEnforceIf(x[i])
+            model.Add(p[i] == 0).OnlyEnforceIf(x[i].Not())
+            model.Add(p[i] <= n_selected)
+        # Unselected venues are shifted to distinct values above n
+        shifted = []
+        for i in range(n):
+            q = model.NewIntVar(0, 2 * n + 1, f"shifted_position_{i}")
+            model.Add(q == p[i] + (n + 1 + i) * (1 - x[i]))
+            shifted.append(q)
+        model.AddAllDifferent(shifted)
+
+        # 3. No overlapping visits
+        intervals = [
+            model.NewOptionalFixedSizeIntervalVar(
+                t[i], dwell[i], x[i], f"visit_{i}"
+            )
+            for i in range(n)
+        ]
+        model.AddNoOverlap(intervals)
+
+        # 4. Travel between consecutive venues
+        total_travel_time = []
+        for i in range(n):
+            for j in range(n):
+                if i == j or not valid[i] or not valid[j]:
+                    continue
+
+                # arc is true iff j directly follows i
+                arc = model.NewBoolVar(f"arc_{i}_{j}")
+                follows = model.NewBoolVar(f"follows_{i}_{j}")
+                model.Add(p[j] == p[i] + 1).OnlyEnforceIf(follows)
+                model.Add(p[j] != p[i] + 1).OnlyEnforceIf(follows.Not())
+                model.AddBoolAnd([follows, x[i], x[j]]).OnlyEnforceIf(arc)
+                model.AddBoolOr([follows.Not(), x[i].Not(), x[j].Not(), arc])
+
+                # Travel slots from i to j, keyed by when i ends
+                end_travel = []
+                for s in range(self.n_slots):
+                    end = s + dwell[i]
+                    minutes = (
+                        self.travel_times.get(
+                            (self.venues[i], self.venues[j],
+                             self.time_slots[end], self.day)
+                        )
+                        if end < self.n_slots else None
+                    )
+                    end_travel.append(
+                        0 if minutes is None else (minutes + 29) // 30
+                    )
+                end_slots = model.NewIntVar(
+                    0, max(end_travel), f"travel_slots_{i}_{j}"
+                )
+                model.AddElement(t[i], end_travel, end_slots)
+                model.Add(
+                    t[j] >= t[i] + dwell[i] + end_slots
+                ).OnlyEnforceIf(arc)
+                model.Add(
+                    t[j] <= latest_valid[j] - dwell[j]
+                ).OnlyEnforceIf(arc)
+
+                # Travel time from i to j, keyed by when i starts
+                start_minutes = [
+                    self.travel_times.get(
+                        (self.venues[i], self.venues[j],
+                         self.time_slots[s], self.day),
+                        0
+                    )
+                    for s in range(self.n_slots)
+                ]
+                if i < j:
+                    start_slots = [(m + 29) // 30 for m in start_minutes]
+                    start_travel = model.NewIntVar(
+                        0, max(start_slots), f"start_travel_slots_{i}_{j}"
+                    )
+                    model.AddElement(t[i], start_slots, start_travel)
+                    model.Add(
+                        t[j] >= t[i] + dwell[i] + start_travel
+                    ).OnlyEnforceIf(arc)
+
+                # Travel time contributed to the objective
+                minutes_var = model.NewIntVar(
+                    0, max(start_minutes), f"travel_minutes_{i}_{j}"
+                )
+                model.AddElement(t[i], start_minutes, minutes_var)
+                cost = model.NewIntVar(
+                    0, max(start_minutes), f"travel_cost_{i}_{j}"
+                )
+                model.Add(cost == minutes_var).OnlyEnforceIf(arc)
+                model.Add(cost == 0).OnlyEnforceIf(arc.Not())
+                total_travel_time.append(cost)
+
+        # 5. Crowd exposure over the whole visit, keyed by start slot
+        total_crowd_level = []
+        for i, venue in enumerate(self.venues):
+            crowd_sums = [
+                sum(
+                    self.crowd_levels.get(
+                        (venue, self.time_slots[s + offset], self.day), 0
+                    )
+                    for offset in range(dwell[i])
+                    if s + offset < self.n_slots
+                )
+                for s in range(self.n_slots)
+            ]
+            crowd_var = model.NewIntVar(
+                min(crowd_sums), max(crowd_sums), f"crowd_{i}"
+            )
+            model.AddElement(t[i], crowd_sums, crowd_var)
+            cost = model.NewIntVar(
+                min(0, min(crowd_sums)), max(0, max(crowd_sums)),
+                f"crowd_cost_{i}"
+            )
+            model.Add(cost == crowd_var).OnlyEnforceIf(x[i])
+            model.Add(cost == 0).OnlyEnforceIf(x[i].Not())
+            total_crowd_level.append(cost)
+
+        self._native_terms = (
+            sum(total_travel_time), sum(total_crowd_level), n_selected
+        )
+
+        # The CPMpy objective truncates each normalized term, keep the same
+        # truncated terms so both models rank solutions alike
+        truncated = []
+        for name, costs, norm in zip(
+            ("travel", "crowd", "venues"),
+            (total_travel_time, total_crowd_level, x),
+            self._objective_norms()
+        ):
+            lower = sum(cost.Proto().domain[0] for cost in costs)
+            upper = sum(cost.Proto().domain[-1] for cost in costs)
+            total = model.NewIntVar(lower, upper, f"total_{name}")
+            model.Add(total == sum(costs))
+            normalized = model.NewIntVar(
+                lower // norm, upper // norm, f"normalized_{name}"
+            )
+            model.AddDivisionEquality(normalized, total, norm)
+            truncated.append(normalized)
+        self._native_truncated_terms = tuple(truncated)
+        self._native_t = t
+        self._native_x = x
+        self._native_p = p
+        self._set_native_objective(model)
+        return model
+
+    def _set_native_objective(self, model: cp_model.CpModel) -> None:
+        """Set the objective of the native model from the current weights.
+
+        Replaces any previous objective, leaving the constraints untouched.
+
+        Args:
+            model: The CP-SAT model built by _build_native_model()
+        """
+        # Objective, normalized as in _set_objective()
+        int_coefs = self._integer_objective_coefficients()
+        if int_coefs is not None:
+            model.Minimize(sum(
+                c * term for c, term in zip(int_coefs, self._native_terms)
+            ))
+        else:
+            weights = (self.w_travel, self.w_crowd, self.w_venues)
+            model.Minimize(sum(
+                w * term
+                for w, term in zip(weights, self._native_truncated_terms)
+            ))
+
+    def solve(
+        self,
+        num_cores: int = 4,
+        time_limit: int = 300,
+        native: bool = False,
+        solution_callback: Optional[SolutionProgressCallback] = None,
+        warm_start: bool = False
+    ) -> Optional[Dict]:
+        """Solve the model and return the solution if found.
+
         Args:
             num_cores: Number of CPU cores to use for parallel solving (default: 4)
             time_limit: Time limit in seconds for the solver (default: 300)
-        
+            native: Build and solve the model with the OR-Tools CP-SAT API
+                directly instead of through CPMpy (default: False)
+            solution_callback: Callback recording each improving solution
+                found during the search (optional)
+            warm_start: Hint the solver with the last solution found by this
+                optimizer, e.g. when re-solving with new objective weights
+                (default: False)
+
         Returns:
             Dict containing the solution details if found:
             - selected_venues: List of selected venues in visit order
@@ -522,13 +875,39 @@ class TourOptimizer:
         logger = logging.getLogger(__name__)
         logger.info("Starting optimization...")
         
+        if native:
+            return self._solve_native(
+                num_cores, time_limit, solution_callback, warm_start
+            )
+        
         try:
             # Create a new solver instance
             solver = CPM_ortools(self.model)
             
-            # Attempt to solve the model
-            if solver.solve():
+            if solution_callback is not None:
+                solution_callback.watch(
+                    solver.solver_vars(self.x), solver.solver_vars(self.p)
+                )
+            
+            if warm_start and self._solution_hint is not None:
+                solver.solution_hint(
+                    self.t + self.p + self.x,
+                    [v for values in self._solution_hint for v in values]
+                )
+            
+            # Attempt to solve the model, running CP-SAT's parallel
+            # portfolio on num_cores workers
+            if solver.solve(
+                time_limit=time_limit,
+                solution_callback=solution_callback,
+                num_search_workers=num_cores
+            ):
                 logger.info("Solution found successfully")
+                self._solution_hint = (
+                    [int(v.value()) for v in self.t],
+                    [int(v.value()) for v in self.p],
+                    [int(v.value()) for v in self.x]
+                )
                 return self._format_solution()
             else:
                 logger.warning("No solution found within constraints")
@@ -538,14 +917,91 @@ class TourOptimizer:
             logger.error(f"Error during optimization: {str(e)}")
             return None
     
-    def _format_solution(self) -> Dict:
-        """Format the solution into a readable dictionary."""
+    def _solve_native(
+        self,
+        num_cores: int,
+        time_limit: int,
+        solution_callback: Optional[SolutionProgressCallback] = None,
+        warm_start: bool = False
+    ) -> Optional[Dict]:
+        """Solve the native CP-SAT model built by _build_native_model().
+        
+        The model is built once and reused while the constraints are
+        unchanged; later solves only replace the objective.
+        
+        Args:
+            num_cores: Number of CPU cores to use for parallel solving
+            time_limit: Time limit in seconds for the solver
+            solution_callback: Callback recording each improving solution
+                found during the search (optional)
+            warm_start: Hint the solver with the last solution found
+        
+        Returns:
+            Solution dictionary if found, None otherwise
+        """
+        try:
+            model = self._native_model
+            if model is None:
+                model = self._native_model = self._build_native_model()
+            else:
+                self._set_native_objective(model)
+            
+            model.ClearHints()
+            if warm_start and self._solution_hint is not None:
+                native_vars = self._native_t + self._native_p + self._native_x
+                hint = [v for values in self._solution_hint for v in values]
+                for var, value in zip(native_vars, hint):
+                    model.AddHint(var, value)
+            
+            if solution_callback is not None:
+                solution_callback.watch(self._native_x, self._native_p)
+            
+            solver = cp_model.CpSolver()
+            solver.parameters.num_search_workers = num_cores
+            solver.parameters.max_time_in_seconds = time_limit
+            status = solver.Solve(model, solution_callback)
+            
+            if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                logger.info("Solution found successfully")
+                t_val = [solver.Value(t) for t in self._native_t]
+                p_val = [solver.Value(p) for p in self._native_p]
+                x_val = [solver.Value(x) for x in self._native_x]
+                self._solution_hint = (t_val, p_val, x_val)
+                return self._format_solution(
+                    x_val=[bool(v) for v in x_val],
+                    t_val=t_val,
+                    p_val=p_val
+                )
+            else:
+                logger.warning("No solution found within constraints")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error during optimization: {str(e)}")
+            return None
+    
+    def _format_solution(
+        self,
+        x_val: Optional[List[bool]] = None,
+        t_val: Optional[List[int]] = None,
+        p_val: Optional[List[int]] = None
+    ) -> Dict:
+        """Format the solution into a readable dictionary.
+        
+        Args:
+            x_val: Venue selection values (default: read from CPMpy variables)
+            t_val: Start slot values (default: read from CPMpy variables)
+            p_val: Position values (default: read from CPMpy variables)
+        """
         logger = logging.getLogger(__name__)
         
         # Get solution values - use the value() method on the variables
-        x_val = [bool(x.value()) for x in self.x]
-        t_val = [int(t.value()) for t in self.t]
-        p_val = [int(p.value()) for p in self.p]
+        if x_val is None:
+            x_val = [bool(x.value()) for x in self.x]
+        if t_val is None:
+            t_val = [int(t.value()) for t in self.t]
+        if p_val is None:
+            p_val = [int(p.value()) for p in self.p]
         
         # Create ordered list of selected venues
         selected_indices = [i for i in range(self.n_venues) if x_val[i]]
@@ -752,6 +1208,11 @@ class TourOptimizer:
     ):
         """Set the weights for the multi-objective optimization function.
         
+        With integer weights (e.g. floats scaled by 100 and rounded) both
+        the CPMpy and the native model minimize the exact normalized
+        objective. Otherwise each normalized term is truncated to an integer
+        before it is weighted.
+        
         Args:
             travel_weight: Weight for travel time minimization (default: 1.0)
             crowd_weight: Weight for crowd level minimization (default: 0.5)
@@ -5,11 +5,14 @@ generate an optimized tour itinerary for Toronto attractions.
 """
 
 import argparse
+import functools
 import logging
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
-from .model import TourOptimizer
-from .data_loader import DataLoader
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from .model import TourOptimizer, SolutionProgressCallback
+from .data_loader import DataLoader, MISSING_TRAVEL_TIME
 
 
 # Configure logging
@@ -19,14 +22,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Data directory shared by the optimization scripts
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+# Time slots from 9:00 AM to 10:30 PM in 30-min intervals, built once
+_TIME_SLOTS_9_TO_22 = tuple(
+    f"{hour:02d}:{minute:02d}" for hour in range(9, 23) for minute in (0, 30)
+)
+
+
+# Objective weights are scaled by this factor and rounded, since CP-SAT works
+# with integer coefficients only
+_WEIGHT_SCALE = 100
+
 
 def generate_time_slots() -> List[str]:
     """Generate time slots from 9:00 AM to 10:30 PM in 30-min intervals."""
-    slots = []
-    for hour in range(9, 23):
-        slots.append(f"{hour:02d}:00")
-        slots.append(f"{hour:02d}:30")
-    return slots
+    return list(_TIME_SLOTS_9_TO_22)
 
 
 def analyze_venue_constraints(
@@ -34,7 +46,8 @@ def analyze_venue_constraints(
     dwell_times: Dict[str, float],
     venue_open_slots: Dict[Any, List[int]],
     time_slots: List[str],
-    day: str
+    day: str,
+    open_mask: Optional[np.ndarray] = None
 ) -> None:
     """Analyze and log venue constraints that might affect selection.
     
@@ -44,15 +57,22 @@ def analyze_venue_constraints(
         venue_open_slots: Dict mapping (venue, day) to list of valid slots
         time_slots: List of time slots in HH:MM format
         day: Day of the week for the tour
+        open_mask: bool array of shape (venues, slots) of open slots on the
+            given day (optional, built from venue_open_slots if not given)
     """
     logger.info("Analyzing venue constraints that might affect selection:")
     
+    n_slots = len(time_slots)
+    if open_mask is None:
+        open_mask = np.zeros((len(venues), n_slots), dtype=np.bool_)
+        for i, venue in enumerate(venues):
+            open_mask[i, venue_open_slots.get((venue, day), [])] = True
+    
     # Check if any venues have no open slots for the selected day
-    venues_without_slots = []
-    for venue in venues:
-        key = (venue, day)
-        if key not in venue_open_slots or not venue_open_slots[key]:
-            venues_without_slots.append(venue)
+    has_slots: np.ndarray = np.any(open_mask, axis=1)
+    venues_without_slots = [
+        venue for venue, is_open in zip(venues, has_slots) if not is_open
+    ]
     
     if venues_without_slots:
         logger.warning(
@@ -60,35 +80,28 @@ def analyze_venue_constraints(
             f"{', '.join(venues_without_slots)}"
         )
     
-    # Log dwell times for each venue
-    logger.info("Venue dwell times:")
-    for venue in venues:
-        logger.info(f"  {venue}: {dwell_times[venue]:.1f} hours")
-    
-    # Log opening hours for each venue
-    logger.info(f"Venue opening hours on {day}:")
-    for venue in venues:
-        key = (venue, day)
-        if key in venue_open_slots and venue_open_slots[key]:
-            open_slots = venue_open_slots[key]
-            if open_slots:
-                start_slot = min(open_slots)
-                end_slot = max(open_slots)
-                if start_slot < len(time_slots) and end_slot < len(time_slots):
-                    start_time = time_slots[start_slot]
-                    # Add dwell time to get the latest possible start time
-                    latest_start_slot = end_slot - int(dwell_times[venue] * 2) + 1
-                    latest_start_time = time_slots[max(0, min(latest_start_slot, len(time_slots)-1))]
-                    logger.info(
-                        f"  {venue}: Opens at {start_time}, "
-                        f"Latest start time: {latest_start_time}"
-                    )
-                else:
-                    logger.warning(f"  {venue}: Invalid slot indices")
-            else:
-                logger.warning(f"  {venue}: No open slots on {day}")
-        else:
-            logger.warning(f"  {venue}: No opening hours data for {day}")
+    # Log dwell times for all venues in one record
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Venue dwell times:\n" + "\n".join(
+            f"  {venue}: {dwell_times[venue]:.1f} hours" for venue in venues
+        ))
+    
+    # First and last open slot, and latest start that fits the dwell time
+    dwell_arr = np.array([dwell_times[venue] for venue in venues])
+    dwell_slots = (dwell_arr * 2).astype(np.int32)
+    start_slot = open_mask.argmax(axis=1)
+    end_slot = n_slots - 1 - open_mask[:, ::-1].argmax(axis=1)
+    latest_start = np.clip(end_slot - dwell_slots + 1, 0, n_slots - 1)
+    
+    # Log opening hours for all open venues in one record
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Venue opening hours on {day}:\n" + "\n".join(
+            f"  {venue}: Opens at {time_slots[start_slot[i]]}, "
+            f"Latest start time: {time_slots[latest_start[i]]}"
+            for i, venue in enumerate(venues) if has_slots[i]
+        ))
+    for venue in venues_without_slots:
+        logger.warning(f"  {venue}: No open slots on {day}")
 
 
 def analyze_objective_weights(
@@ -128,92 +141,135 @@ def analyze_objective_weights(
         )
 
 
-def main():
-    """Main function to run the tour optimization."""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(
-        description="Optimize a tour itinerary using constraint programming"
-    )
-    parser.add_argument(
-        "--cores", 
-        type=int, 
-        default=4,
-        help="Number of CPU cores to use for parallel solving (default: 4)"
-    )
-    parser.add_argument(
-        "--time-limit", 
-        type=int, 
-        default=300,
-        help="Time limit in seconds for the solver (default: 300)"
-    )
-    parser.add_argument(
-        "--day", 
-        type=str, 
-        # default="Monday",
-        default="Tuesday",
-        choices=[
-            "Monday", "Tuesday", "Wednesday", "Thursday", 
-            "Friday", "Saturday", "Sunday"
-        ],
-        help="Day of the week for the tour (default: Monday)"
-    )
-    parser.add_argument(
-        "--verbose", 
-        action="store_true",
-        help="Enable verbose logging"
-    )
-    parser.add_argument(
-        "--debug-constraints", 
-        action="store_true",
-        help="Enable detailed constraint debugging"
+@functools.lru_cache(maxsize=4)
+def load_problem(
+    data_dir: Path,
+    time_slots: Tuple[str, ...]
+) -> Tuple[
+    DataLoader,
+    Dict[str, float],
+    Dict[Tuple[str, str, str, str], int],
+    Dict[Tuple[str, str, str], int],
+    Dict[Tuple[str, str], List[int]]
+]:
+    """Load all data needed to build a tour model, cached across calls.
+    
+    The data is parsed once per (data_dir, time_slots) so that batch runs,
+    e.g. sweeping days or objective weights, skip re-reading the data
+    files. The returned data is shared between callers and must not be
+    modified. The venue data cache from build_venue_cache is used when it
+    is up to date. The raw venue data is not needed for the optimization,
+    so it is dropped rather than kept alive by the cache.
+    
+    Args:
+        data_dir: Path to directory containing data files
+        time_slots: Tuple of time slots in HH:MM format
+    
+    Returns:
+        Tuple of the DataLoader followed by the results of
+        DataLoader.load_all() other than the venue data
+    """
+    data_loader = DataLoader(data_dir)
+    (
+        _,
+        dwell_times,
+        travel_times,
+        crowd_levels,
+        venue_open_slots
+    ) = data_loader.load_all(list(time_slots), use_cache=True)
+    return (
+        data_loader,
+        dwell_times,
+        travel_times,
+        crowd_levels,
+        venue_open_slots
     )
-    args = parser.parse_args()
+
+
+def run_tour(
+    day: str = "Tuesday",
+    weights: Tuple[float, float, float] = (0.05, 0.05, -5000),
+    cores: int = 4,
+    time_limit: int = 300,
+    debug_constraints: bool = False,
+    data_dir: Path = DATA_DIR
+) -> Optional[Dict]:
+    """Optimize a tour for one day and log the analysis along the way.
     
-    # Set logging level based on verbose flag
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    The default weights keep travel and crowd weights low and use a much
+    stronger venues weight, to strongly favor visiting multiple venues.
     
-    logger.info(f"Starting tour optimization for {args.day}")
+    Args:
+        day: Day of the week for the tour
+        weights: (travel, crowd, venues) objective weights
+        cores: Number of CPU cores to use for parallel solving
+        time_limit: Time limit in seconds for the solver
+        debug_constraints: Log detailed constraint debugging information
+        data_dir: Path to directory containing data files
     
-    # Set up paths
-    data_dir = Path(__file__).parent.parent.parent / "data"
-    logger.info(f"Using data directory: {data_dir}")
+    Returns:
+        Solution dictionary if found, None otherwise
     
-    # Initialize data loader
-    data_loader = DataLoader(data_dir)
+    Raises:
+        ValueError: If a non-zero weight rounds to 0 once scaled to an
+            integer, i.e. its magnitude is 0.005 or less
+    """
+    # Scale the weights to integers, so the objective is exact
+    int_weights = [round(weight * _WEIGHT_SCALE) for weight in weights]
+    for name, weight, int_weight in zip(
+        ("travel", "crowd", "venues"), weights, int_weights
+    ):
+        if weight and not int_weight:
+            raise ValueError(
+                f"The {name} weight {weight} rounds to 0, weights are "
+                f"applied in steps of {1 / _WEIGHT_SCALE}"
+            )
+    
+    logger.info(f"Starting tour optimization for {day}")
+    
+    logger.info(f"Using data directory: {data_dir}")
     
     # Generate time slots
     time_slots = generate_time_slots()
+    slot_idx = {slot: i for i, slot in enumerate(time_slots)}
     logger.info(f"Generated {len(time_slots)} time slots from {time_slots[0]} to {time_slots[-1]}")
     
-    # Load all required data
+    # Load all required data (cached across runs)
     logger.info("Loading venue data...")
     (
-        venue_data,
+        data_loader,
         dwell_times,
         travel_times,
         crowd_levels,
         venue_open_slots
-    ) = data_loader.load_all(time_slots)
+    ) = load_problem(data_dir, tuple(time_slots))
     
-    # Get list of venues
-    venues = list(dwell_times.keys())
+    # Get list of venues in a stable order, longest visits first so the
+    # solver branches on the hardest venues to place early
+    venues = sorted(dwell_times, key=lambda v: -dwell_times[v])
+    venue_idx = {venue: i for i, venue in enumerate(venues)}
+    # Rows of the loader's arrays for each venue, in the order above
+    venue_rows = np.array([data_loader.venue_idx[venue] for venue in venues])
     logger.info(f"Loaded data for {len(venues)} venues: {', '.join(venues)}")
     
+    # load_all() has built the loader's dense arrays
+    assert data_loader.open_mask is not None
+    assert data_loader.tt_array is not None
+    
+    # Open slots of each venue on the tour day, shape (venues, slots)
+    open_mask = data_loader.open_mask[venue_rows, data_loader.day_idx[day]]
+    
     # Analyze venue constraints
     analyze_venue_constraints(
         venues,
         dwell_times,
         venue_open_slots,
         time_slots,
-        args.day
+        day,
+        open_mask=open_mask
     )
     
-    # Set custom objective weights to strongly favor multiple venues
-    # Keep travel and crowd weights low to prioritize venue count
-    travel_weight = 0.05   # Reduced weight for travel time
-    crowd_weight = 0.05    # Reduced weight for crowds
-    venues_weight = -5000  # Much stronger weight to maximize venues
+    travel_weight, crowd_weight, venues_weight = weights
     
     # Analyze objective weights
     analyze_objective_weights(
@@ -224,20 +280,22 @@ def main():
     
     # Check for missing travel time data and add default values
     logger.info("Checking for missing travel time data...")
-    for from_venue in venues:
-        for to_venue in venues:
-            if from_venue != to_venue:
-                # Check a sample time slot
-                sample_time = time_slots[0]
-                travel_key = (from_venue, to_venue, sample_time, args.day)
-                if travel_key not in travel_times:
-                    # Add a default travel time (30 minutes)
-                    logger.warning(
-                        f"Missing travel time from {from_venue} to {to_venue}. "
-                        f"Adding default value of 30 minutes."
-                    )
-                    for time_slot in time_slots:
-                        travel_times[(from_venue, to_venue, time_slot, args.day)] = 30
+    tt_day = data_loader.tt_array[
+        np.ix_(venue_rows, venue_rows)
+    ][:, :, :, data_loader.day_idx[day]]
+    missing = tt_day == MISSING_TRAVEL_TIME
+    # Travel from a venue to itself is never needed
+    missing[np.diag_indices(len(venues))] = False
+    if missing.any():
+        logger.warning(
+            f"Missing travel time for {int(missing.sum())} venue pair time "
+            f"slots. Adding default value of 30 minutes."
+        )
+        # Add a default travel time (30 minutes) to a copy, since the
+        # loaded data is shared between runs
+        travel_times = dict(travel_times)
+        for i, j, slot in zip(*np.nonzero(missing)):
+            travel_times[(venues[i], venues[j], time_slots[slot], day)] = 30
     
     # Create optimizer for the specified day
     optimizer = TourOptimizer(
@@ -249,22 +307,19 @@ def main():
         venue_open_slots=venue_open_slots,
         tour_start_time="09:00",  # Keep early start
         tour_end_time="22:30",    # Extended to allow more venues
-        day=args.day  # Use the day from command line arguments
+        day=day
     )
     
     # Set aggressive minimum venues target with optimized solver
-    min_venues = 3 if args.day == "Monday" else 4
+    min_venues = 3 if day == "Monday" else 4
     optimizer.set_min_venues(min_venues)
 
-    # Set custom objective weights with strong preference for multiple venues
-    optimizer.set_objective_weights(
-        travel_weight=travel_weight,
-        crowd_weight=crowd_weight,
-        venues_weight=venues_weight
-    )
+    # Set custom objective weights with strong preference for multiple venues,
+    # scaled to integers
+    optimizer.set_objective_weights(*int_weights)
     
     # Debug: Log the constraint model details if requested
-    if args.debug_constraints:
+    if debug_constraints:
         logger.info("Constraint model details:")
         # The Model object doesn't have a 'variables' attribute we can access directly
         # logger.info(f"Number of variables: {len(optimizer.model.variables)}")
@@ -273,7 +328,7 @@ def main():
         # Log time window constraints
         logger.info("Time window constraints:")
         for i, venue in enumerate(venues):
-            key = (venue, args.day)
+            key = (venue, day)
             if key in venue_open_slots:
                 valid_slots = venue_open_slots[key]
                 logger.info(f"  {venue}: {len(valid_slots)} valid slots")
@@ -287,53 +342,35 @@ def main():
                         break
                 logger.info(f"  {venue}: Can fit within tour hours: {can_fit}")
     
-    logger.info(f"Optimizing tour for {args.day} using {args.cores} CPU cores...")
-    logger.info(f"Solver time limit: {args.time_limit} seconds")
-    
-    # Try multiple iterations with increasing time limits to check for local optima
-    solutions = []
-    time_increments = [30, 60, 120, args.time_limit]
+    logger.info(f"Optimizing tour for {day} using {cores} CPU cores...")
+    logger.info(f"Solver time limit: {time_limit} seconds")
     
-    for i, time_limit in enumerate(time_increments):
-        if time_limit > args.time_limit:
-            break
-            
-        logger.info(f"Solving attempt {i+1} with time limit: {time_limit} seconds")
-        
-        # Solve the optimization problem with multi-threading
-        solution = optimizer.solve(
-            num_cores=args.cores,
-            time_limit=time_limit
-        )
-        
-        if solution:
-            selected_venues = solution.get("selected_venues", [])
-            logger.info(f"Solution found with {len(selected_venues)} venues: {', '.join(selected_venues)}")
-            solutions.append((time_limit, solution))
+    # Solve once, recording each improving solution found by the solver
+    progress = SolutionProgressCallback(venues)
+    solution = optimizer.solve(
+        num_cores=cores,
+        time_limit=time_limit,
+        solution_callback=progress
+    )
     
     # Check if solutions improved over time (indicating local optima issues)
-    if len(solutions) > 1:
+    if len(progress.solutions) > 1:
         logger.info("Analyzing solution progression:")
-        for i, (time_limit, solution) in enumerate(solutions):
-            venues_count = len(solution.get("selected_venues", []))
-            logger.info(f"  Time limit {time_limit}s: {venues_count} venues")
-            
-        # Check if later solutions have more venues
-        improved = False
-        for i in range(1, len(solutions)):
-            prev_count = len(solutions[i-1][1].get("selected_venues", []))
-            curr_count = len(solutions[i][1].get("selected_venues", []))
-            if curr_count > prev_count:
-                improved = True
-                logger.info(f"Solution improved from {prev_count} to {curr_count} venues with more time")
-                
-        if improved:
-            logger.warning("Solver appears to be getting stuck in local optima - solutions improved with more time")
+        for wall_time, objective, selected in progress.solutions:
+            logger.info(
+                f"  {wall_time:.1f}s: objective {objective:.3f}, "
+                f"{len(selected)} venues"
+            )
+        
+        first_count = len(progress.solutions[0][2])
+        final_count = len(progress.solutions[-1][2])
+        if final_count > first_count:
+            logger.info(
+                f"Solution improved from {first_count} to {final_count} "
+                "venues with more time"
+            )
         else:
-            logger.info("No improvement in solutions with more time - likely not a local optima issue")
-    
-    # Use the final solution
-    solution = solutions[-1][1] if solutions else None
+            logger.info("No improvement in venue count with more time")
     
     if solution:
         logger.info("Final solution found!")
@@ -342,132 +379,189 @@ def main():
         
         # Log why only one venue might have been selected
         if len(selected_venues) == 1:
-            logger.warning(
+            logger.warning("\n".join([
                 f"Only one venue ({selected_venues[0]}) was selected. "
-                "This could be due to:"
-            )
-            logger.warning(
+                "This could be due to:",
                 "1. Tight time constraints: The tour start/end times might not "
-                "allow visiting multiple venues with their required dwell times."
-            )
-            logger.warning(
+                "allow visiting multiple venues with their required dwell times.",
                 "2. Venue opening hours: Other venues might not be open during "
-                f"the specified day ({args.day}) or have limited hours."
-            )
-            logger.warning(
+                f"the specified day ({day}) or have limited hours.",
                 "3. Objective weights: The current weights "
                 f"(travel={travel_weight}, crowd={crowd_weight}, "
                 f"venues={venues_weight}) might not provide enough incentive "
-                "to visit multiple venues."
-            )
-            logger.warning(
+                "to visit multiple venues.",
                 "4. Solver time limit: The solver might not have had enough time "
                 "to find a solution with more venues."
-            )
+            ]))
             
             # Additional debugging for single venue case
             logger.warning("Detailed constraint analysis for single venue case:")
             
             # Check if any venues could theoretically be added
             selected_venue = selected_venues[0]
-            selected_idx = venues.index(selected_venue)
-            selected_start_slot = time_slots.index(solution["start_times"][selected_venue])
+            selected_idx = venue_idx[selected_venue]
+            selected_start_slot = slot_idx[solution["start_times"][selected_venue]]
             selected_end_slot = selected_start_slot + optimizer.dwell_slots[selected_venue]
             
             logger.warning(f"Selected venue {selected_venue} occupies slots {selected_start_slot}-{selected_end_slot}")
             
-            # Check each other venue to see if it could fit before or after
+            # Check which venues could fit before or after the selected venue,
+            # for all venues at once
+            slots = np.arange(len(time_slots))[None, :]
+            dwell_arr = np.array([optimizer.dwell_slots[venue] for venue in venues])
+            slot_end = slots + dwell_arr[:, None]
+            can_fit_before = (open_mask & (slot_end <= selected_start_slot)).any(axis=1)
+            can_fit_after = (
+                open_mask &
+                (slots >= selected_end_slot) &
+                (slot_end <= optimizer.tour_end_slot)
+            ).any(axis=1)
+            first_open = open_mask.argmax(axis=1)
+            
             for i, venue in enumerate(venues):
-                if venue == selected_venue:
+                if venue == selected_venue or (venue, day) not in venue_open_slots:
                     continue
-                    
-                dwell = optimizer.dwell_slots[venue]
-                key = (venue, args.day)
                 
-                if key in venue_open_slots:
-                    valid_slots = venue_open_slots[key]
-                    
-                    # Check if venue could fit before selected venue
-                    could_fit_before = False
-                    for slot in valid_slots:
-                        if slot + dwell <= selected_start_slot:
-                            could_fit_before = True
-                            break
-                            
-                    # Check if venue could fit after selected venue
-                    could_fit_after = False
-                    for slot in valid_slots:
-                        if slot >= selected_end_slot and slot + dwell <= optimizer.tour_end_slot:
-                            could_fit_after = True
-                            break
-                            
-                    logger.warning(f"  {venue}: Could fit before: {could_fit_before}, Could fit after: {could_fit_after}")
+                could_fit_before = bool(can_fit_before[i])
+                could_fit_after = bool(can_fit_after[i])
+                logger.warning(f"  {venue}: Could fit before: {could_fit_before}, Could fit after: {could_fit_after}")
+                
+                # If venue could fit but wasn't selected, check travel times
+                if could_fit_before:
+                    end_time = time_slots[min(first_open[i] + dwell_arr[i], len(time_slots)-1)]
+                    travel_key = (venue, selected_venue, end_time, day)
+                    travel_time = travel_times.get(travel_key, "unknown")
+                    logger.warning(f"    Travel time from {venue} to {selected_venue}: {travel_time}")
                     
-                    # If venue could fit but wasn't selected, investigate why
-                    if could_fit_before or could_fit_after:
-                        # Check travel times
-                        if could_fit_before:
-                            end_time = time_slots[min(valid_slots[0] + dwell, len(time_slots)-1)]
-                            travel_key = (venue, selected_venue, end_time, args.day)
-                            travel_time = travel_times.get(travel_key, "unknown")
-                            logger.warning(f"    Travel time from {venue} to {selected_venue}: {travel_time}")
-                            
-                        if could_fit_after:
-                            start_time = time_slots[selected_end_slot]
-                            travel_key = (selected_venue, venue, start_time, args.day)
-                            travel_time = travel_times.get(travel_key, "unknown")
-                            logger.warning(f"    Travel time from {selected_venue} to {venue}: {travel_time}")
+                if could_fit_after:
+                    start_time = time_slots[selected_end_slot]
+                    travel_key = (selected_venue, venue, start_time, day)
+                    travel_time = travel_times.get(travel_key, "unknown")
+                    logger.warning(f"    Travel time from {selected_venue} to {venue}: {travel_time}")
+    
+    return solution
+
+
+def main(
+    cores: int = 4,
+    time_limit: int = 300,
+    day: str = "Tuesday",
+    verbose: bool = False,
+    debug_constraints: bool = False
+):
+    """Main function to run the tour optimization.
+    
+    Can be called directly by batch drivers, skipping the command line
+    parsing done by _cli().
+    
+    Args:
+        cores: Number of CPU cores to use for parallel solving
+        time_limit: Time limit in seconds for the solver
+        day: Day of the week for the tour
+        verbose: Enable verbose logging
+        debug_constraints: Enable detailed constraint debugging
+    """
+    # Set logging level based on verbose flag
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    solution = run_tour(
+        day=day,
+        cores=cores,
+        time_limit=time_limit,
+        debug_constraints=debug_constraints
+    )
+    
+    if solution:
+        selected_venues = solution.get("selected_venues", [])
         
-        print("\nOptimized Tour Schedule:")
-        print("=" * 50)
+        # Build the report and write it out in one go
+        out = ["", "Optimized Tour Schedule:", "=" * 50]
         
-        # Print schedule
+        # Schedule
         for visit in solution["schedule"]:
-            print(f"\n{visit['venue']}:")
-            print(f"  Start time: {visit['start_time']}")
-            print(f"  End time: {visit['end_time']}")
-            print(f"  Duration: {visit['dwell_time_hours']:.1f} hours")
-            print(f"  Crowd level: {visit['crowd_level_avg']:.1f}")
+            out.append(f"\n{visit['venue']}:")
+            out.append(f"  Start time: {visit['start_time']}")
+            out.append(f"  End time: {visit['end_time']}")
+            out.append(f"  Duration: {visit['dwell_time_hours']:.1f} hours")
+            out.append(f"  Crowd level: {visit['crowd_level_avg']:.1f}")
             if visit['travel_time_to_next'] is not None:
                 travel_time = visit['travel_time_to_next']
-                print(
-                    "  Travel to next venue: "
-                    f"{travel_time} min"
-                )
+                out.append(f"  Travel to next venue: {travel_time} min")
         
-        # Print metrics
-        print("\nTour Metrics:")
-        print("=" * 50)
+        # Metrics
         metrics = solution["metrics"]
-        print(f"Total venues visited: {metrics['total_venues']}")
-        print(
+        out.extend([
+            "\nTour Metrics:",
+            "=" * 50,
+            f"Total venues visited: {metrics['total_venues']}",
             f"Total travel time: "
-            f"{metrics['total_travel_time_minutes']} minutes"
-        )
-        print(
+            f"{metrics['total_travel_time_minutes']} minutes",
             f"Average travel time: "
-            f"{metrics['average_travel_time']:.1f} minutes"
-        )
-        print(
+            f"{metrics['average_travel_time']:.1f} minutes",
             f"Average crowd level: {metrics['average_crowd_level']:.1f}"
-        )
+        ])
         
-        # Print explanation for single venue selection
+        # Explanation for single venue selection
         if len(selected_venues) == 1:
-            print("\nWhy only one venue was selected:")
-            print("=" * 50)
-            print(
+            out.extend([
+                "\nWhy only one venue was selected:",
+                "=" * 50,
                 "The optimizer selected only one venue due to a combination of factors:\n"
                 "1. Time constraints: The tour's time window might be too narrow for multiple venues\n"
                 "2. Venue opening hours: Other venues might have limited hours on this day\n"
                 "3. Objective weights: Current weights might not incentivize multiple venues enough\n"
                 "4. Solver limitations: The time limit might be too short for complex solutions\n\n"
                 "Try adjusting the objective weights, changing the day, or extending the time window."
-            )
+            ])
+        
+        sys.stdout.write("\n".join(out) + "\n")
     else:
         logger.error("No valid solution found!")
         print("No valid solution found!")
 
 
+def _cli():
+    """Parse command line arguments and run main()."""
+    parser = argparse.ArgumentParser(
+        description="Optimize a tour itinerary using constraint programming"
+    )
+    parser.add_argument(
+        "--cores", 
+        type=int, 
+        default=4,
+        help="Number of CPU cores to use for parallel solving (default: 4)"
+    )
+    parser.add_argument(
+        "--time-limit", 
+        type=int, 
+        default=300,
+        help="Time limit in seconds for the solver (default: 300)"
+    )
+    parser.add_argument(
+        "--day", 
+        type=str, 
+        # default="Monday",
+        default="Tuesday",
+        choices=[
+            "Monday", "Tuesday", "Wednesday", "Thursday", 
+            "Friday", "Saturday", "Sunday"
+        ],
+        help="Day of the week for the tour (default: Monday)"
+    )
+    parser.add_argument(
+        "--verbose", 
+        action="store_true",
+        help="Enable verbose logging"
+    )
+    parser.add_argument(
+        "--debug-constraints", 
+        action="store_true",
+        help="Enable detailed constraint debugging"
+    )
+    args = parser.parse_args()
+    main(**vars(args))
+
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    _cli() 
\ No newline at end of file
@@ -12,28 +12,31 @@ The analysis focuses on three objectives:
 The Pareto front shows the trade-offs between these competing objectives.
 """
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Union
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import concurrent.futures
+from multiprocessing import shared_memory
 from .model import TourOptimizer
-from .data_loader import DataLoader
+from .data_loader import CrowdLevels, DataLoader, TravelTimeMatrix
 from .optimize_tour import generate_time_slots
 
 
 def generate_weight_combinations(
     n_points: int = 10
-) -> List[Tuple[float, float, float]]:
+) -> np.ndarray:
     """Generate different weight combinations for the objective function.
     
     Args:
         n_points: Number of points to generate for each weight
     
     Returns:
-        List of (w_travel, w_crowd, w_venues) weight combinations
+        float64 array of shape (combinations, 3) with one
+        (w_travel, w_crowd, w_venues) row per distinct direction
         Note: w_venues is negative to maximize number of venues
     """
     # Generate positive weights between 0.1 and 1.0 for travel and crowd
@@ -42,14 +45,21 @@ def generate_weight_combinations(
     # We use negative weights because we want to maximize venues
     negative_weights = np.linspace(-1, -40, n_points)
     
-    # Generate all combinations of weights
-    combinations = []
-    for w_travel in positive_weights:
-        for w_crowd in positive_weights:
-            for w_venues in negative_weights:
-                combinations.append((w_travel, w_crowd, w_venues))
+    # Generate all combinations of weights, in travel-major order
+    grids = np.meshgrid(
+        positive_weights, positive_weights, negative_weights, indexing='ij'
+    )
+    combinations = np.stack([grid.ravel() for grid in grids], axis=1)
+    
+    # Scaling all weights by the same positive factor does not change the
+    # optimum, so only the first combination for each normalized direction
+    # is kept
+    directions = np.round(
+        combinations / np.abs(combinations).sum(axis=1, keepdims=True), 4
+    )
+    _, first = np.unique(directions, axis=0, return_index=True)
     
-    return combinations
+    return combinations[np.sort(first)]
 
 
 def is_pareto_optimal(
@@ -73,79 +83,281 @@ def is_pareto_optimal(
     crowd_level = metrics["average_crowd_level"]
     venues_visited = metrics["total_venues"]
     
-    # Check if any other solution dominates this one
+    # Check if any other solution dominates this one, moving on as soon as
+    # one objective shows that it does not
+    # Note: For venues_visited, higher is better
     for other in all_solutions:
         if other is solution:
             continue
         
         other_metrics = other["metrics"]
         other_travel = other_metrics["total_travel_time_minutes"]
+        if other_travel > travel_time:
+            continue
         other_crowd = other_metrics["average_crowd_level"]
+        if other_crowd > crowd_level:
+            continue
         other_venues = other_metrics["total_venues"]
+        if other_venues < venues_visited:
+            continue
         
-        # Check if other solution is better in all objectives
-        # Note: For venues_visited, higher is better, so we check if other_venues > venues_visited
-        if (other_travel <= travel_time and 
-            other_crowd <= crowd_level and 
-            other_venues >= venues_visited and
-            (other_travel < travel_time or 
-             other_crowd < crowd_level or 
-             other_venues > venues_visited)):
+        # Other solution is at least as good in all objectives, so it
+        # dominates this one if it is strictly better in any of them
+        if (other_travel < travel_time or 
+            other_crowd < crowd_level or 
+            other_venues > venues_visited):
             return False
     
     return True
 
 
+def _objective_matrix(solutions: List[Dict]) -> np.ndarray:
+    """Collect the objectives of all solutions into one array.
+    
+    The venues column is negated so that all three objectives are minimized.
+    
+    Args:
+        solutions: List of solutions
+    
+    Returns:
+        float64 array of shape (solutions, 3) with columns travel time,
+        crowd level and negated number of venues
+    """
+    P = np.empty((len(solutions), 3), dtype=np.float64)
+    for row, s in zip(P, solutions):
+        metrics = s["metrics"]
+        row[0] = metrics["total_travel_time_minutes"]
+        row[1] = metrics["average_crowd_level"]
+        row[2] = -metrics["total_venues"]
+    return P
+
+
+def _pareto_mask(P: np.ndarray) -> np.ndarray:
+    """Mark the non-dominated rows of an objective matrix.
+    
+    Rows are visited in lexicographic order, so a row can only be dominated
+    by a row visited before it. By transitivity it is enough to compare each
+    row against the front found so far.
+    
+    Args:
+        P: float64 array of shape (solutions, objectives), all minimized
+    
+    Returns:
+        bool array that is True for the Pareto-optimal rows
+    """
+    mask = np.zeros(len(P), dtype=np.bool_)
+    front = np.empty_like(P)
+    n_front = 0
+    for i in np.lexsort(P.T[::-1]):
+        row = P[i]
+        candidates = front[:n_front]
+        dominated = (
+            (candidates <= row).all(axis=1) & (candidates < row).any(axis=1)
+        ).any()
+        if not dominated:
+            mask[i] = True
+            front[n_front] = row
+            n_front += 1
+    return mask
+
+
+def _pareto_sweep_kernel(P, order):
+    """Loop version of _pareto_mask, compiled by _compiled_pareto_mask().
+    
+    Runs the same sorted sweep, comparing each row only against the front
+    found so far, without per-row NumPy overhead.
+    
+    Args:
+        P: C-contiguous float64 array of shape (solutions, objectives)
+        order: int64 row indices of P in lexicographic order
+    """
+    n_rows, n_objectives = P.shape
+    mask = np.zeros(n_rows, dtype=np.bool_)
+    front = np.empty(n_rows, dtype=np.int64)
+    n_front = 0
+    for i in order:
+        dominated = False
+        for f in range(n_front):
+            j = front[f]
+            at_least_as_good = True
+            better = False
+            for k in range(n_objectives):
+                if P[j, k] > P[i, k]:
+                    at_least_as_good = False
+                    break
+                if P[j, k] < P[i, k]:
+                    better = True
+            if at_least_as_good and better:
+                dominated = True
+                break
+        if not dominated:
+            mask[i] = True
+            front[n_front] = i
+            n_front += 1
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _compiled_pareto_mask() -> Optional[Callable]:
+    """Compile _pareto_sweep_kernel with numba, on first use.
+    
+    numba is optional (see requirements-optional.txt). It is only imported
+    when a Pareto mask is computed, so importing this module stays cheap.
+    The kernel is compiled once per process, which takes well under a
+    second. It is not cached on disk: the cache is keyed by the module
+    name, which differs between the tests (cpm) and the scripts (src.cpm).
+    It is not compiled with parallel=True either: that loads numba's
+    threading layer, and with TBB the interpreter then hangs at exit once
+    the process pool has been used.
+    
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit("boolean[:](float64[:, ::1], int64[::1])")(
+        _pareto_sweep_kernel
+    )
+
+
+def _pareto_front_mask(P: np.ndarray) -> np.ndarray:
+    """Mark the non-dominated rows of an objective matrix.
+    
+    Runs the sorted sweep of _pareto_mask, compiled when numba is available.
+    
+    Args:
+        P: float64 array of shape (solutions, objectives), all minimized
+    
+    Returns:
+        bool array that is True for the Pareto-optimal rows
+    """
+    kernel = _compiled_pareto_mask()
+    if kernel is None:
+        return _pareto_mask(P)
+    P = np.ascontiguousarray(P, dtype=np.float64)
+    order = np.lexsort(P.T[::-1]).astype(np.int64)
+    return kernel(P, order)
+
+
+def _add_to_frontier(
+    frontier: List[Tuple[Tuple[float, ...], int]],
+    row: Tuple[float, ...],
+    index: int
+) -> bool:
+    """Add a solution to a running Pareto frontier.
+    
+    The solution is dropped if a frontier entry dominates it; otherwise the
+    entries it dominates are removed and it is appended.
+    
+    Args:
+        frontier: (objectives, index) of the non-dominated solutions so far,
+            updated in place
+        row: Objectives of the new solution, all minimized
+        index: Index of the new solution
+    
+    Returns:
+        True if the solution was added to the frontier
+    """
+    for other, _ in frontier:
+        if other != row and all(a <= b for a, b in zip(other, row)):
+            return False
+    frontier[:] = [
+        (other, j) for other, j in frontier
+        if other == row or not all(a <= b for a, b in zip(row, other))
+    ]
+    frontier.append((row, index))
+    return True
+
+
 def identify_pareto_optimal_solutions(
-    solutions: List[Dict]
-) -> List[Dict]:
+    solutions: List[Dict],
+    return_mask: bool = False
+) -> Union[List[Dict], Tuple[List[Dict], np.ndarray]]:
     """Identify Pareto-optimal solutions from a list of solutions.
     
     Args:
         solutions: List of solutions
+        return_mask: Also return the bool mask of the Pareto-optimal
+            solutions, e.g. to use as a column alongside all solutions
+            (default: False)
     
     Returns:
-        List of Pareto-optimal solutions
+        List of Pareto-optimal solutions, or a tuple of that list and the
+        mask if return_mask is True
     """
-    return [s for s in solutions if is_pareto_optimal(s, solutions)]
+    mask = _pareto_front_mask(_objective_matrix(solutions))
+    pareto_solutions = [solutions[i] for i in np.flatnonzero(mask)]
+    if return_mask:
+        return pareto_solutions, mask
+    return pareto_solutions
+
+
+# Most solutions drawn in the 3D view, to keep it fast and readable
+_MAX_3D_POINTS = 500
 
 
 def visualize_pareto_front(
     solutions: List[Dict],
     pareto_solutions: List[Dict],
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    objectives: Optional[np.ndarray] = None,
+    pareto_mask: Optional[np.ndarray] = None
 ):
-    """Visualize the Pareto front in 3D.
+    """Visualize the Pareto front in 3D, with a 2D plot per objective pair.
     
     Args:
         solutions: List of all solutions
         pareto_solutions: List of Pareto-optimal solutions
         output_path: Path to save the plot (optional)
+        objectives: Objective matrix of the solutions, as returned by
+            _objective_matrix() (optional, extracted if not given)
+        pareto_mask: bool array marking the Pareto-optimal rows of
+            objectives (optional, extracted from pareto_solutions if not given)
     """
-    # Extract metrics for all solutions
-    all_travel = [s["metrics"]["total_travel_time_minutes"] for s in solutions]
-    all_crowd = [s["metrics"]["average_crowd_level"] for s in solutions]
-    all_venues = [s["metrics"]["total_venues"] for s in solutions]
-    
-    # Extract metrics for Pareto-optimal solutions
-    pareto_travel = [s["metrics"]["total_travel_time_minutes"] for s in pareto_solutions]
-    pareto_crowd = [s["metrics"]["average_crowd_level"] for s in pareto_solutions]
-    pareto_venues = [s["metrics"]["total_venues"] for s in pareto_solutions]
+    # Render off-screen when only saving to files
+    if output_path:
+        plt.switch_backend("Agg")
     
-    # Create 3D plot
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
+    # Metrics of all solutions, as columns shared by all plots
+    if objectives is None:
+        objectives = _objective_matrix(solutions)
+    all_travel, all_crowd, all_venues = objectives.T
+    all_venues = -all_venues
     
-    # Plot all solutions
+    # Metrics of Pareto-optimal solutions
+    if pareto_mask is None:
+        pareto_objectives = _objective_matrix(pareto_solutions)
+    else:
+        pareto_objectives = objectives[pareto_mask]
+    pareto_travel, pareto_crowd, pareto_venues = pareto_objectives.T
+    pareto_venues = -pareto_venues
+    
+    # Create one figure with the 3D view on top and a 2D plot for each pair
+    # of objectives below it
+    fig = plt.figure(figsize=(18, 16))
+    gs = fig.add_gridspec(2, 3, height_ratios=(1.6, 1))
+    ax = fig.add_subplot(gs[0, :], projection='3d')
+    axs = [fig.add_subplot(gs[1, col]) for col in range(3)]
+    
+    # Plot a random sample of all solutions, faintly, as context for the
+    # Pareto-optimal ones
+    n_all = len(all_travel)
+    sample = np.random.default_rng(0).choice(
+        n_all, size=min(n_all, _MAX_3D_POINTS), replace=False
+    )
     ax.scatter(
-        all_travel, all_crowd, all_venues,
-        c='blue', marker='o', alpha=0.3, label='All Solutions'
+        all_travel[sample], all_crowd[sample], all_venues[sample],
+        c='blue', marker='o', alpha=0.2, label='All Solutions (sample)',
+        rasterized=True
     )
     
     # Plot Pareto-optimal solutions
     ax.scatter(
         pareto_travel, pareto_crowd, pareto_venues,
-        c='red', marker='o', s=100, label='Pareto-Optimal Solutions'
+        c='red', marker='o', s=100, label='Pareto-Optimal Solutions',
+        rasterized=True
     )
     
     # Add labels and title
@@ -157,90 +369,151 @@ def visualize_pareto_front(
     # Add legend
     ax.legend()
     
-    # Save or show the plot
-    if output_path:
-        plt.savefig(output_path)
-    else:
-        plt.show()
-    
-    # Create 2D plots for each pair of objectives
-    fig, axs = plt.subplots(1, 3, figsize=(18, 6))
+    # Density of all solutions in each 2D plot
+    if n_all:
+        for ax2d, (x, y) in zip(axs, (
+            (all_travel, all_crowd),
+            (all_travel, all_venues),
+            (all_crowd, all_venues)
+        )):
+            ax2d.hexbin(x, y, gridsize=40, cmap='Blues', mincnt=1)
     
     # Travel Time vs Crowd Level
-    axs[0].scatter(all_travel, all_crowd, c='blue', alpha=0.3)
-    axs[0].scatter(pareto_travel, pareto_crowd, c='red', s=100)
+    axs[0].scatter(
+        pareto_travel, pareto_crowd, c='red', s=60, rasterized=True
+    )
     axs[0].set_xlabel('Travel Time (minutes)')
     axs[0].set_ylabel('Average Crowd Level')
     axs[0].set_title('Travel Time vs Crowd Level')
     
     # Travel Time vs Venues Visited
-    axs[1].scatter(all_travel, all_venues, c='blue', alpha=0.3)
-    axs[1].scatter(pareto_travel, pareto_venues, c='red', s=100)
+    axs[1].scatter(
+        pareto_travel, pareto_venues, c='red', s=60, rasterized=True
+    )
     axs[1].set_xlabel('Travel Time (minutes)')
     axs[1].set_ylabel('Number of Venues Visited')
     axs[1].set_title('Travel Time vs Venues Visited')
     
     # Crowd Level vs Venues Visited
-    axs[2].scatter(all_crowd, all_venues, c='blue', alpha=0.3)
-    axs[2].scatter(pareto_crowd, pareto_venues, c='red', s=100)
+    axs[2].scatter(
+        pareto_crowd, pareto_venues, c='red', s=60, rasterized=True
+    )
     axs[2].set_xlabel('Average Crowd Level')
     axs[2].set_ylabel('Number of Venues Visited')
     axs[2].set_title('Crowd Level vs Venues Visited')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Save or show the 2D plots
+    # Save or show the plots
     if output_path:
-        base_path = output_path.rsplit('.', 1)[0]
-        plt.savefig(f"{base_path}_2d.png")
+        plt.savefig(output_path, dpi=100)
     else:
         plt.show()
+    plt.close(fig)
 
 
-def run_model_with_weights(
-    data_loader: DataLoader,
+def _share_array(arr: np.ndarray) -> shared_memory.SharedMemory:
+    """Copy an array into a new shared memory block.
+    
+    The caller owns the block and must close and unlink it.
+    
+    Args:
+        arr: Array to share
+    
+    Returns:
+        SharedMemory block holding the array data
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm
+
+
+# State shared by all tasks of a worker process: the problem data, venues,
+# time slots and day set by _init_worker(), and the optimizer built by the
+# first task and reused across weight combinations
+_WORKER_STATE: Dict = {}
+
+
+def _init_worker(
+    problem_data: Tuple,
+    shared_arrays: Dict[str, Tuple],
+    index: Tuple[Dict, Dict, Dict],
     venues: List[str],
     time_slots: List[str],
-    day: str,
-    w_travel: float,
-    w_crowd: float,
-    w_venues: float,
-    i: Optional[int] = None,
-    total: Optional[int] = None
-) -> Optional[Dict]:
-    """Run the model with specific weights for the objective function.
+    day: str
+):
+    """Store the problem shared by all tasks in a worker process.
+    
+    The travel times and crowd levels stay in shared memory: the worker
+    keeps the blocks open for its lifetime and the optimizer reads them
+    through TravelTimeMatrix and CrowdLevels views.
     
     Args:
-        data_loader: DataLoader instance
+        problem_data: (dwell_times, venue_open_slots) as returned by
+            DataLoader.load_all()
+        shared_arrays: Dict mapping "travel_times" and "crowd_levels" to the
+            (shared memory name, shape, dtype) of the loader's tt_array and
+            crowd_array
+        index: (venue_idx, slot_idx, day_idx) of the shared arrays
+        venues: List of venue names
+        time_slots: List of time slots
+        day: Day of the week
+    """
+    shared_blocks = []
+    arrays = {}
+    for name, (shm_name, shape, dtype) in shared_arrays.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        shared_blocks.append(shm)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    venue_idx, slot_idx, day_idx = index
+    
+    dwell_times, venue_open_slots = problem_data
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(
+        # Same layout as DataLoader.load_all(), without the venue metadata
+        problem_data=(
+            None,
+            dwell_times,
+            TravelTimeMatrix(
+                arrays["travel_times"], venue_idx, slot_idx, day_idx
+            ),
+            CrowdLevels(arrays["crowd_levels"], venue_idx, day_idx),
+            venue_open_slots
+        ),
+        venues=venues,
+        time_slots=time_slots,
+        day=day,
+        # Keeps the shared memory mapped while the views are in use
+        shared_blocks=shared_blocks
+    )
+
+
+def _build_optimizer(
+    problem_data: Tuple,
+    venues: List[str],
+    time_slots: List[str],
+    day: str
+) -> TourOptimizer:
+    """Build the optimizer for a day, without setting objective weights.
+    
+    Args:
+        problem_data: Tuple returned by DataLoader.load_all()
         venues: List of venue names
         time_slots: List of time slots
         day: Day of the week
-        w_travel: Weight for travel time
-        w_crowd: Weight for crowd levels
-        w_venues: Weight for number of venues (negative to maximize)
-        i: Optional index for progress reporting
-        total: Optional total count for progress reporting
     
     Returns:
-        Solution dictionary if found, None otherwise
+        TourOptimizer instance
     """
-    # Print progress if index is provided
-    if i is not None and total is not None:
-        print(
-            f"Running model with weights ({w_travel:.2f}, {w_crowd:.2f}, "
-            f"{w_venues:.2f}) [{i+1}/{total}]"
-        )
-    
-    # Load all required data
+    # Unpack the preloaded data, the venue metadata is not needed
     (
-        venue_data,
+        _,
         dwell_times,
         travel_times,
         crowd_levels,
         venue_open_slots
-    ) = data_loader.load_all(time_slots)
+    ) = problem_data
     
-    # Create a new optimizer instance for this run
     optimizer = TourOptimizer(
         venues=venues,
         dwell_times=dwell_times,
@@ -256,15 +529,47 @@ def run_model_with_weights(
     # Set minimum number of venues to visit
     optimizer.set_min_venues(3 if day == "Monday" else 4)
     
+    return optimizer
+
+
+def run_model_with_weights(
+    problem_data: Tuple,
+    venues: List[str],
+    time_slots: List[str],
+    day: str,
+    w_travel: float,
+    w_crowd: float,
+    w_venues: float,
+    optimizer: Optional[TourOptimizer] = None
+) -> Optional[Dict]:
+    """Run the model with specific weights for the objective function.
+    
+    Args:
+        problem_data: Tuple returned by DataLoader.load_all()
+        venues: List of venue names
+        time_slots: List of time slots
+        day: Day of the week
+        w_travel: Weight for travel time
+        w_crowd: Weight for crowd levels
+        w_venues: Weight for number of venues (negative to maximize)
+        optimizer: Optimizer from an earlier run on the same data and day
+            (optional). Its native CP-SAT model is kept and only the
+            objective is replaced, and the solver is warm started from its
+            last solution.
+    
+    Returns:
+        Solution dictionary if found, None otherwise
+    """
+    if optimizer is None:
+        optimizer = _build_optimizer(problem_data, venues, time_slots, day)
+    
     # Set custom weights for the objective function
     # Note: w_venues is already negative to maximize venues
-    optimizer.w_travel = w_travel
-    optimizer.w_crowd = w_crowd
-    # Use w_venues directly since it's already negative
-    optimizer.w_venues = w_venues
+    optimizer.set_objective_weights(w_travel, w_crowd, w_venues)
     
-    # Solve the model
-    solution = optimizer.solve()
+    # Solve the native model, which is built on the first solve and
+    # reused by later ones
+    solution = optimizer.solve(native=True, warm_start=True)
     
     # Add weights to solution for reference if solution exists
     if solution:
@@ -281,25 +586,33 @@ def run_model_with_weights(
 def worker_run_model(args):
     """Worker function for parallel execution of run_model_with_weights.
     
+    Uses the problem stored by _init_worker(), and reuses one optimizer
+    across the tasks run by this worker.
+    
     Args:
-        args: Tuple containing (i, weights, data_loader, venues, time_slots, 
-              day, total)
+        args: (w_travel, w_crowd, w_venues) weights of the task
     
     Returns:
         Result from run_model_with_weights
     """
-    i, weights, data_loader, venues, time_slots, day, total = args
-    w_travel, w_crowd, w_venues = weights
+    w_travel, w_crowd, w_venues = args
+    state = _WORKER_STATE
+    if "optimizer" not in state:
+        state["optimizer"] = _build_optimizer(
+            state["problem_data"],
+            state["venues"],
+            state["time_slots"],
+            state["day"]
+        )
     return run_model_with_weights(
-        data_loader=data_loader,
-        venues=venues,
-        time_slots=time_slots,
-        day=day,
+        problem_data=state["problem_data"],
+        venues=state["venues"],
+        time_slots=state["time_slots"],
+        day=state["day"],
         w_travel=w_travel,
         w_crowd=w_crowd,
         w_venues=w_venues,
-        i=i,
-        total=total
+        optimizer=state["optimizer"]
     )
 
 
@@ -314,7 +627,7 @@ def run_pareto_analysis(
     Args:
         day: Day of the week for the tour
         n_weight_points: Number of points for each weight 
-                         (generates n_weight_points^3 combinations)
+                         (generates up to n_weight_points^3 combinations)
         output_dir: Directory to save output files (optional)
         max_workers: Maximum number of parallel workers (default: None, which 
                      uses the number of processors on the machine)
@@ -331,11 +644,22 @@ def run_pareto_analysis(
     # Generate time slots
     time_slots = generate_time_slots()
     
-    # Load venue data to get list of venues
-    venue_data, dwell_times, _, _, _ = data_loader.load_all(time_slots)
-    
     # Get list of venues
-    venues = list(dwell_times.keys())
+    venues = data_loader.list_venues()
+    
+    # Load all data once, it is shared by every weight combination. The
+    # venue metadata is not needed by the optimizer, so the venue data
+    # cache can be used, and the travel times and crowd levels are shared
+    # from the loader's dense arrays.
+    (
+        _,
+        dwell_times,
+        _,
+        _,
+        venue_open_slots
+    ) = data_loader.load_all(time_slots, use_cache=True)
+    assert data_loader.tt_array is not None
+    assert data_loader.crowd_array is not None
     
     # Generate weight combinations
     weight_combinations = generate_weight_combinations(n_weight_points)
@@ -345,27 +669,89 @@ def run_pareto_analysis(
         f"with up to {max_workers} parallel workers"
     )
     
-    # Run model with each weight combination in parallel
-    all_solutions = []
-    
-    # Use ProcessPoolExecutor for CPU-bound tasks
-    with concurrent.futures.ProcessPoolExecutor(
-        max_workers=max_workers
-    ) as executor:
-        # Prepare arguments for each worker
-        worker_args = [
-            (i, weights, data_loader, venues, time_slots, day, 
-             len(weight_combinations))
-            for i, weights in enumerate(weight_combinations)
-        ]
-        
-        # Submit all tasks and collect results
-        for solution in executor.map(worker_run_model, worker_args):
-            if solution:
-                all_solutions.append(solution)
-    
-    # Identify Pareto-optimal solutions
-    pareto_solutions = identify_pareto_optimal_solutions(all_solutions)
+    # Run model with each weight combination in parallel, keeping the
+    # objectives of every solution and a running Pareto frontier
+    all_solutions: List[Dict] = []
+    rows: List[Tuple[float, ...]] = []
+    frontier: List[Tuple[Tuple[float, ...], int]] = []
+    
+    # Put the travel time and crowd level arrays in shared memory, so all
+    # workers read one copy instead of each receiving a pickled dict
+    shared_blocks = []
+    shared_arrays = {}
+    for name, arr in (
+        ("travel_times", data_loader.tt_array),
+        ("crowd_levels", data_loader.crowd_array)
+    ):
+        shm = _share_array(arr)
+        shared_blocks.append(shm)
+        shared_arrays[name] = (shm.name, arr.shape, arr.dtype.str)
+    
+    try:
+        # Use ProcessPoolExecutor for CPU-bound tasks, sending the problem
+        # once per worker so that each task only carries its weights
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(
+                (dwell_times, venue_open_slots),
+                shared_arrays,
+                (
+                    data_loader.venue_idx,
+                    data_loader.slot_idx,
+                    data_loader.day_idx
+                ),
+                venues,
+                time_slots,
+                day
+            )
+        ) as executor:
+            # Prepare arguments for each worker
+            worker_args = [tuple(weights) for weights in weight_combinations]
+            
+            # Send tasks in batches to cut the per-task IPC round trips
+            n_workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(worker_args) // (4 * n_workers))
+            
+            # Collect results, reporting progress as they arrive
+            total = len(worker_args)
+            results = executor.map(
+                worker_run_model, worker_args, chunksize=chunksize
+            )
+            for i, (weights, solution) in enumerate(
+                zip(weight_combinations, results)
+            ):
+                if solution:
+                    metrics = solution["metrics"]
+                    row = (
+                        float(metrics["total_travel_time_minutes"]),
+                        float(metrics["average_crowd_level"]),
+                        float(-metrics["total_venues"])
+                    )
+                    _add_to_frontier(frontier, row, len(all_solutions))
+                    all_solutions.append(solution)
+                    rows.append(row)
+                w_travel, w_crowd, w_venues = weights
+                print(
+                    f"Finished model with weights ({w_travel:.2f}, "
+                    f"{w_crowd:.2f}, {w_venues:.2f}) [{i+1}/{total}], "
+                    f"{len(frontier)} on the Pareto front"
+                )
+    finally:
+        for shm in shared_blocks:
+            shm.close()
+            shm.unlink()
+    
+    # Objectives as columns shared by the plots and the CSV
+    objectives = np.array(rows, dtype=np.float64).reshape(-1, 3)
+    travel = objectives[:, 0].astype(np.int32)
+    crowd = objectives[:, 1]
+    n_visited = (-objectives[:, 2]).astype(np.int32)
+    
+    # The running frontier only reports progress while the models run;
+    # the Pareto-optimal solutions come from one batch pass over them all
+    pareto_mask = _pareto_front_mask(objectives)
+    pareto_solutions = [all_solutions[i] for i in np.flatnonzero(pareto_mask)]
     
     print(f"Found {len(all_solutions)} valid solutions")
     print(f"Identified {len(pareto_solutions)} Pareto-optimal solutions")
@@ -373,31 +759,38 @@ def run_pareto_analysis(
     # Visualize Pareto front
     if output_dir:
         output_path = Path(output_dir) / "pareto_front.png"
-        visualize_pareto_front(all_solutions, pareto_solutions, str(output_path))
+        visualize_pareto_front(
+            all_solutions, pareto_solutions, str(output_path),
+            objectives=objectives, pareto_mask=pareto_mask
+        )
     else:
-        visualize_pareto_front(all_solutions, pareto_solutions)
+        visualize_pareto_front(
+            all_solutions, pareto_solutions,
+            objectives=objectives, pareto_mask=pareto_mask
+        )
     
     # Save solutions to CSV
     if output_dir:
         output_dir_path = Path(output_dir)
         output_dir_path.mkdir(exist_ok=True)
         
-        # Create DataFrame for all solutions
-        solution_data = []
-        for sol in all_solutions:
-            metrics = sol["metrics"]
-            weights = sol["weights"]
-            solution_data.append({
-                "travel_time": metrics["total_travel_time_minutes"],
-                "crowd_level": metrics["average_crowd_level"],
-                "venues_visited": metrics["total_venues"],
-                "w_travel": weights["w_travel"],
-                "w_crowd": weights["w_crowd"],
-                "w_venues": weights["w_venues"],
-                "is_pareto_optimal": sol in pareto_solutions
-            })
-        
-        df = pd.DataFrame(solution_data)
+        # Create DataFrame for all solutions, column by column
+        n_solutions = len(all_solutions)
+        weight_columns = {
+            name: np.fromiter(
+                (sol["weights"][name] for sol in all_solutions),
+                dtype=np.float64,
+                count=n_solutions
+            )
+            for name in ("w_travel", "w_crowd", "w_venues")
+        }
+        df = pd.DataFrame({
+            "travel_time": travel,
+            "crowd_level": crowd,
+            "venues_visited": n_visited,
+            **weight_columns,
+            "is_pareto_optimal": pareto_mask
+        })
         df.to_csv(output_dir_path / "pareto_solutions.csv", index=False)
     
     return all_solutions, pareto_solutions
@@ -1,68 +1,213 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pytest
-from .model import TourOptimizer, DayOfWeek
-from .data_loader import DataLoader
+from .model import (
+    TourOptimizer, DayOfWeek, DAY_TO_INT, SolutionProgressCallback
+)
+from .data_loader import (
+    CrowdLevels,
+    DataLoader,
+    MISSING_TRAVEL_TIME,
+    TravelTimeMatrix
+)
+from .pareto_analysis import (
+    _add_to_frontier,
+    identify_pareto_optimal_solutions,
+    is_pareto_optimal
+)
 
+# Test time slots from 9:00 AM to 9:30 PM in 30-min intervals
+_TIME_SLOTS_9_TO_21 = tuple(
+    f"{hour:02d}:{minute:02d}" for hour in range(9, 22) for minute in (0, 30)
+)
 
-class TestTourOptimizer:
-    @pytest.fixture
-    def data_dir(self) -> Path:
-        """Get the data directory path."""
-        return Path(__file__).parent.parent.parent / "data"
-    
-    @pytest.fixture
-    def data_loader(self, data_dir: Path) -> DataLoader:
-        """Create a data loader instance."""
-        return DataLoader(data_dir)
-    
-    @pytest.fixture
-    def venue_data(self, data_loader: DataLoader) -> Dict:
-        """Load venue data for testing."""
-        return data_loader.load_venue_data()
-    
-    @pytest.fixture
-    def dwell_times(self, data_loader: DataLoader) -> Dict[str, float]:
-        """Load venue dwell times."""
-        return data_loader.load_dwell_times()
-    
-    @pytest.fixture
-    def time_slots(self) -> List[str]:
-        """Generate time slots for testing (30 min intervals)."""
-        slots = []
-        for hour in range(9, 22):  # 9:00 AM to 9:30 PM
-            slots.append(f"{hour:02d}:00")
-            slots.append(f"{hour:02d}:30")
-        return slots
+# Minutes since midnight for every HH:MM time of the day, built once
+_MIN_CACHE = {
+    f"{hour:02d}:{minute:02d}": hour * 60 + minute
+    for hour in range(24) for minute in range(60)
+}
+
+
+def _validate_schedule(
+    schedule: List[Dict],
+    travel_time_matrix: TravelTimeMatrix,
+    day: DayOfWeek,
+    require_travel_times: bool = False
+) -> None:
+    """Assert that visits don't overlap and respect travel times.
     
-    @pytest.fixture
-    def travel_times(
-        self,
-        data_loader: DataLoader,
-        time_slots: List[str]
-    ) -> Dict[Tuple[str, str, str, DayOfWeek], int]:
-        """Load travel times between venues."""
-        return data_loader.load_travel_times(time_slots)
+    All consecutive visits are checked at once. Visit pairs without a
+    known travel time are only checked for overlap, unless
+    require_travel_times is set.
+    """
+    n_visits = len(schedule)
+    start_min = np.fromiter(
+        (_MIN_CACHE[visit["start_time"]] for visit in schedule),
+        dtype=np.int32, count=n_visits
+    )
+    end_min = np.fromiter(
+        (_MIN_CACHE[visit["end_time"]] for visit in schedule),
+        dtype=np.int32, count=n_visits
+    )
+    gap = start_min[1:] - end_min[:-1]
+    overlaps = np.flatnonzero(gap < 0)
+    assert not overlaps.size, (
+        f"Venue visits overlap: {schedule[overlaps[0]]['venue']} ends at "
+        f"{schedule[overlaps[0]]['end_time']} but "
+        f"{schedule[overlaps[0] + 1]['venue']} starts at "
+        f"{schedule[overlaps[0] + 1]['start_time']}"
+    )
     
-    @pytest.fixture
-    def crowd_levels(
-        self,
-        data_loader: DataLoader,
-        venue_data: Dict
-    ) -> Dict[Tuple[str, str, DayOfWeek], int]:
-        """Extract crowd levels from venue data."""
-        return data_loader.extract_crowd_levels(venue_data)
-    
-    @pytest.fixture
-    def venue_open_slots(
-        self,
-        data_loader: DataLoader,
-        venue_data: Dict,
-        time_slots: List[str]
-    ) -> Dict[Tuple[str, DayOfWeek], List[int]]:
-        """Extract venue operating hours."""
-        return data_loader.extract_operating_hours(venue_data, time_slots)
+    # Look up the travel time of every leg in one indexing operation
+    venue_idx = np.fromiter(
+        (travel_time_matrix.venue_idx[visit["venue"]] for visit in schedule),
+        dtype=np.intp, count=n_visits
+    )
+    slot_idx = np.fromiter(
+        (travel_time_matrix.slot_idx.get(visit["end_time"], -1)
+         for visit in schedule[:-1]),
+        dtype=np.intp, count=max(0, n_visits - 1)
+    )
+    known = slot_idx >= 0
+    # Widen the int8 travel times to int32, like the gaps
+    expected = np.full(len(gap), MISSING_TRAVEL_TIME, dtype=np.int32)
+    expected[known] = travel_time_matrix.matrix[
+        venue_idx[:-1][known],
+        venue_idx[1:][known],
+        slot_idx[known],
+        travel_time_matrix.day_idx[day]
+    ]
+    known &= expected != MISSING_TRAVEL_TIME
+    if require_travel_times:
+        assert known.all(), f"Missing travel times on {day}"
+    too_short = np.flatnonzero(known & (gap < expected))
+    assert not too_short.size, (
+        f"On {day}, gap between {schedule[too_short[0]]['venue']} and "
+        f"{schedule[too_short[0] + 1]['venue']} ({gap[too_short[0]]} min) "
+        f"is less than required travel time ({expected[too_short[0]]} min)"
+    )
+
+
+@pytest.fixture(scope="session")
+def data_dir() -> Path:
+    """Get the data directory path."""
+    return Path(__file__).parent.parent.parent / "data"
+
+
+@pytest.fixture(scope="session")
+def data_loader(data_dir: Path) -> DataLoader:
+    """Create a data loader instance."""
+    return DataLoader(data_dir)
+
+
+@pytest.fixture(scope="session")
+def venue_data(data_loader: DataLoader) -> Dict:
+    """Load venue data for testing."""
+    return data_loader.load_venue_data()
+
+
+@pytest.fixture(scope="module")
+def venue_day_index(venue_data: Dict) -> Dict[str, Dict[str, Dict]]:
+    """Index the venue data analysis of each venue by day name."""
+    return {
+        venue: {
+            day_data["day_info"]["day_text"]: day_data
+            for day_data in data["analysis"]
+        }
+        for venue, data in venue_data.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def dwell_times(data_loader: DataLoader) -> Dict[str, float]:
+    """Load venue dwell times."""
+    return data_loader.load_dwell_times()
+
+
+@pytest.fixture(scope="session")
+def time_slots() -> List[str]:
+    """Generate time slots for testing (30 min intervals)."""
+    return list(_TIME_SLOTS_9_TO_21)
+
+
+@pytest.fixture(scope="session")
+def travel_times(
+    data_loader: DataLoader,
+    time_slots: List[str]
+) -> Dict[Tuple[str, str, str, DayOfWeek], int]:
+    """Load travel times between venues."""
+    return data_loader.load_travel_times(time_slots)
+
+
+@pytest.fixture(scope="session")
+def travel_time_matrix(
+    data_loader: DataLoader,
+    time_slots: List[str]
+) -> TravelTimeMatrix:
+    """Load travel times between venues as a dense array."""
+    return TravelTimeMatrix(
+        *data_loader.load_travel_times_matrix(time_slots)
+    )
+
+
+@pytest.fixture(scope="session")
+def crowd_levels(
+    data_loader: DataLoader,
+    venue_data: Dict
+) -> Dict[Tuple[str, str, DayOfWeek], int]:
+    """Extract crowd levels from venue data."""
+    return data_loader.extract_crowd_levels(venue_data)
+
+
+@pytest.fixture(scope="session")
+def venue_open_slots(
+    data_loader: DataLoader,
+    venue_data: Dict,
+    time_slots: List[str]
+) -> Dict[Tuple[str, DayOfWeek], List[int]]:
+    """Extract venue operating hours."""
+    return data_loader.extract_operating_hours(venue_data, time_slots)
+
+
+@pytest.fixture(scope="module")
+def solutions_by_day(
+    dwell_times: Dict[str, float],
+    time_slots: List[str],
+    travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
+    crowd_levels: Dict[Tuple[str, str, DayOfWeek], int],
+    venue_open_slots: Dict[Tuple[str, DayOfWeek], List[int]]
+) -> Dict[Tuple[str, ...], Dict[DayOfWeek, Optional[Dict]]]:
+    """Solve the tours of the day-varying tests once.
     
+    Solutions are deterministic for the same venues, day and tour
+    window, so the tests share a single solve of each tour. Maps each
+    venue tuple to a dict of solutions by day, None where no solution
+    was found.
+    """
+    test_days: List[DayOfWeek] = ["Monday", "Saturday"]
+    solutions: Dict[
+        Tuple[str, ...], Dict[DayOfWeek, Optional[Dict]]
+    ] = {}
+    for venues in (("CN Tower",), ("CN Tower", "Casa Loma")):
+        solutions[venues] = {}
+        for day in test_days:
+            optimizer = TourOptimizer(
+                venues=list(venues),
+                dwell_times={v: dwell_times[v] for v in venues},
+                time_slots=time_slots,
+                travel_times=travel_times,
+                crowd_levels=crowd_levels,
+                venue_open_slots=venue_open_slots,
+                tour_start_time="09:00",
+                tour_end_time="21:00",
+                day=day
+            )
+            solutions[venues][day] = optimizer.solve()
+    return solutions
+
+
+class TestTourOptimizer:
     def test_basic_initialization(
         self,
         venue_data: Dict,
@@ -100,11 +245,13 @@ class TestTourOptimizer:
         time_slots: List[str],
         travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
         crowd_levels: Dict[Tuple[str, str, DayOfWeek], int],
-        venue_open_slots: Dict[Tuple[str, DayOfWeek], List[int]]
+        venue_open_slots: Dict[Tuple[str, DayOfWeek], List[int]],
+        travel_time_matrix: TravelTimeMatrix
     ):
         """Test solving a basic tour with 3 venues."""
         # Use 3 specific venues that we know should work together
         test_venues = ["CN Tower", "Casa Loma", "Royal Ontario Museum"]
+        expected_venues = frozenset(test_venues)
         test_day: DayOfWeek = "Tuesday"  # Changed from Monday to Tuesday since ROM is closed on Mondays
         
         optimizer = TourOptimizer(
@@ -130,48 +277,14 @@ class TestTourOptimizer:
         
         # Check that all venues are included
         assert len(solution["selected_venues"]) == len(test_venues)
-        assert set(solution["selected_venues"]) == set(test_venues)
+        assert frozenset(solution["selected_venues"]) == expected_venues
         
-        # Check schedule validity
-        schedule = solution["schedule"]
-        for i in range(len(schedule) - 1):
-            current = schedule[i]
-            next_visit = schedule[i + 1]
-            
-            # Check that venues don't overlap in time
-            current_end = current["end_time"]
-            next_start = next_visit["start_time"]
-            assert current_end <= next_start, (
-                f"Venue visits overlap: {current['venue']} ends at {current_end}"
-                f" but {next_visit['venue']} starts at {next_start}"
-            )
-            
-            # Check travel times are respected
-            travel_key = (
-                current["venue"],
-                next_visit["venue"],
-                current_end,
-                test_day
-            )
-            if travel_key in travel_times:
-                min_travel_time = travel_times[travel_key]
-                actual_gap = (
-                    self._time_to_minutes(next_start) -
-                    self._time_to_minutes(current_end)
-                )
-                assert actual_gap >= min_travel_time, (
-                    "Travel time not respected between "
-                    f"{current['venue']} and {next_visit['venue']}"
-                )
-    
-    def _time_to_minutes(self, time_str: str) -> int:
-        """Convert HH:MM time string to minutes since midnight."""
-        hours, minutes = map(int, time_str.split(":"))
-        return hours * 60 + minutes
+        # Check that venues don't overlap and travel times are respected
+        _validate_schedule(solution["schedule"], travel_time_matrix, test_day)
     
     def test_time_window_constraints(
         self,
-        venue_data: Dict,
+        venue_day_index: Dict[str, Dict[str, Dict]],
         dwell_times: Dict[str, float],
         time_slots: List[str],
         travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
@@ -184,11 +297,7 @@ class TestTourOptimizer:
         test_day: DayOfWeek = "Monday"
         
         # Get expected operating hours from venue data
-        cn_tower_data = venue_data["CN Tower"]
-        monday_data = next(
-            day for day in cn_tower_data["analysis"] 
-            if day["day_info"]["day_text"] == "Monday"
-        )
+        monday_data = venue_day_index["CN Tower"]["Monday"]
         expected_open = monday_data["day_info"]["venue_open_close_v2"]["24h"][0]
         
         optimizer = TourOptimizer(
@@ -237,53 +346,23 @@ class TestTourOptimizer:
     
     def test_different_days_operating_hours(
         self,
-        venue_data: Dict,
-        dwell_times: Dict[str, float],
-        time_slots: List[str],
-        travel_times: Dict[
-            Tuple[str, str, str, DayOfWeek],
-            int
-        ],
-        crowd_levels: Dict[
-            Tuple[str, str, DayOfWeek],
-            int
-        ],
-        venue_open_slots: Dict[
-            Tuple[str, DayOfWeek],
-            List[int]
-        ]
+        venue_day_index: Dict[str, Dict[str, Dict]],
+        solutions_by_day: Dict[Tuple[str, ...], Dict[DayOfWeek, Dict]]
     ):
         """Test that the model respects operating hours for different days."""
         test_venues = ["CN Tower"]
         # Test weekday vs weekend
         test_days: List[DayOfWeek] = ["Monday", "Saturday"]
-        solutions: Dict[DayOfWeek, Dict] = {}
         
-        # Get solutions for each day
+        # Get solutions for each day, shared with the other day tests
+        solutions = solutions_by_day[tuple(test_venues)]
         for day in test_days:
-            optimizer = TourOptimizer(
-                venues=test_venues,
-                dwell_times={v: dwell_times[v] for v in test_venues},
-                time_slots=time_slots,
-                travel_times=travel_times,
-                crowd_levels=crowd_levels,
-                venue_open_slots=venue_open_slots,
-                tour_start_time="09:00",
-                tour_end_time="21:00",
-                day=day
-            )
-            solution = optimizer.solve()
-            assert solution is not None, f"Should find solution for {day}"
-            solutions[day] = solution
+            assert solutions[day] is not None, f"Should find solution for {day}"
         
         # Get expected operating hours for each day
-        cn_tower_data = venue_data["CN Tower"]
         operating_hours = {}
         for day in test_days:
-            day_data = next(
-                d for d in cn_tower_data["analysis"]
-                if d["day_info"]["day_text"] == day
-            )
+            day_data = venue_day_index["CN Tower"][day]
             hours = day_data["day_info"]["venue_open_close_v2"]["24h"][0]
             operating_hours[day] = hours
         
@@ -312,44 +391,17 @@ class TestTourOptimizer:
     
     def test_different_days_crowd_levels(
         self,
-        venue_data: Dict,
-        dwell_times: Dict[str, float],
-        time_slots: List[str],
-        travel_times: Dict[
-            Tuple[str, str, str, DayOfWeek],
-            int
-        ],
-        crowd_levels: Dict[
-            Tuple[str, str, DayOfWeek],
-            int
-        ],
-        venue_open_slots: Dict[
-            Tuple[str, DayOfWeek],
-            List[int]
-        ]
+        solutions_by_day: Dict[Tuple[str, ...], Dict[DayOfWeek, Dict]]
     ):
         """Test that the model handles crowd levels for different days."""
         test_venues = ["CN Tower"]
         # Test weekday vs weekend
         test_days: List[DayOfWeek] = ["Monday", "Saturday"]
-        solutions: Dict[DayOfWeek, Dict] = {}
         
-        # Get solutions for each day
+        # Get solutions for each day, shared with the other day tests
+        solutions = solutions_by_day[tuple(test_venues)]
         for day in test_days:
-            optimizer = TourOptimizer(
-                venues=test_venues,
-                dwell_times={v: dwell_times[v] for v in test_venues},
-                time_slots=time_slots,
-                travel_times=travel_times,
-                crowd_levels=crowd_levels,
-                venue_open_slots=venue_open_slots,
-                tour_start_time="09:00",
-                tour_end_time="21:00",
-                day=day
-            )
-            solution = optimizer.solve()
-            assert solution is not None, f"Should find solution for {day}"
-            solutions[day] = solution
+            assert solutions[day] is not None, f"Should find solution for {day}"
         
         # Compare crowd levels between days
         crowd_metrics = {
@@ -371,45 +423,19 @@ class TestTourOptimizer:
     
     def test_different_days_travel_times(
         self,
-        venue_data: Dict,
-        dwell_times: Dict[str, float],
-        time_slots: List[str],
-        travel_times: Dict[
-            Tuple[str, str, str, DayOfWeek],
-            int
-        ],
-        crowd_levels: Dict[
-            Tuple[str, str, DayOfWeek],
-            int
-        ],
-        venue_open_slots: Dict[
-            Tuple[str, DayOfWeek],
-            List[int]
-        ]
+        solutions_by_day: Dict[Tuple[str, ...], Dict[DayOfWeek, Dict]],
+        travel_time_matrix: TravelTimeMatrix
     ):
         """Test that the model handles travel times for different days."""
         # Use two venues to test travel times between them
         test_venues = ["CN Tower", "Casa Loma"]
         # Test weekday vs weekend
         test_days: List[DayOfWeek] = ["Monday", "Saturday"]
-        solutions: Dict[DayOfWeek, Dict] = {}
         
-        # Get solutions for each day
+        # Get solutions for each day, shared with the other day tests
+        solutions = solutions_by_day[tuple(test_venues)]
         for day in test_days:
-            optimizer = TourOptimizer(
-                venues=test_venues,
-                dwell_times={v: dwell_times[v] for v in test_venues},
-                time_slots=time_slots,
-                travel_times=travel_times,
-                crowd_levels=crowd_levels,
-                venue_open_slots=venue_open_slots,
-                tour_start_time="09:00",
-                tour_end_time="21:00",
-                day=day
-            )
-            solution = optimizer.solve()
-            assert solution is not None, f"Should find solution for {day}"
-            solutions[day] = solution
+            assert solutions[day] is not None, f"Should find solution for {day}"
         
         # Check travel times between venues for each day
         for day in test_days:
@@ -420,27 +446,248 @@ class TestTourOptimizer:
             assert len(schedule) == 2, f"Should visit both venues on {day}"
             
             # Check that travel time is respected
-            first_visit = schedule[0]
-            second_visit = schedule[1]
-            
-            # Get actual gap between visits
-            actual_gap = (
-                self._time_to_minutes(second_visit["start_time"]) -
-                self._time_to_minutes(first_visit["end_time"])
+            _validate_schedule(
+                schedule, travel_time_matrix, day, require_travel_times=True
             )
+    
+    def test_native_model_solve_basic_tour(
+        self,
+        dwell_times: Dict[str, float],
+        time_slots: List[str],
+        travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
+        crowd_levels: Dict[Tuple[str, str, DayOfWeek], int],
+        venue_open_slots: Dict[Tuple[str, DayOfWeek], List[int]],
+        travel_time_matrix: TravelTimeMatrix
+    ):
+        """Test solving a basic tour with the native CP-SAT model."""
+        test_venues = ["CN Tower", "Casa Loma", "Royal Ontario Museum"]
+        expected_venues = frozenset(test_venues)
+        test_day: DayOfWeek = "Tuesday"
+        
+        optimizer = TourOptimizer(
+            venues=test_venues,
+            dwell_times={v: dwell_times[v] for v in test_venues},
+            time_slots=time_slots,
+            travel_times=travel_times,
+            crowd_levels=crowd_levels,
+            venue_open_slots=venue_open_slots,
+            tour_start_time="09:00",
+            tour_end_time="21:00",
+            day=test_day
+        )
+        
+        solution = optimizer.solve(native=True)
+        assert solution is not None, "Should find a valid solution"
+        assert frozenset(solution["selected_venues"]) == expected_venues
+        
+        # Check that visits don't overlap and respect travel times
+        _validate_schedule(solution["schedule"], travel_time_matrix, test_day)
+    
+    def test_native_model_matches_cpmpy_objective(
+        self,
+        dwell_times: Dict[str, float],
+        time_slots: List[str],
+        travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
+        crowd_levels: Dict[Tuple[str, str, DayOfWeek], int],
+        venue_open_slots: Dict[Tuple[str, DayOfWeek], List[int]]
+    ):
+        """Test that the CPMpy and native models find the same optimum."""
+        test_venues = [
+            "CN Tower", "Casa Loma", "Royal Ontario Museum",
+            "St. Lawrence Market"
+        ]
+        test_day: DayOfWeek = "Tuesday"
+        
+        # Float weights truncate each normalized term, integer weights
+        # give the exact objective
+        for weights in ((1.0, 0.5, -20.0), (5, 5, -500)):
+            results = {}
+            for native in (False, True):
+                optimizer = TourOptimizer(
+                    venues=test_venues,
+                    dwell_times={v: dwell_times[v] for v in test_venues},
+                    time_slots=time_slots,
+                    travel_times=travel_times,
+                    crowd_levels=crowd_levels,
+                    venue_open_slots=venue_open_slots,
+                    tour_start_time="09:00",
+                    tour_end_time="21:00",
+                    day=test_day
+                )
+                optimizer.set_objective_weights(*weights)
+                progress = SolutionProgressCallback(test_venues)
+                solution = optimizer.solve(
+                    native=native, solution_callback=progress
+                )
+                assert solution is not None, "Should find a valid solution"
+                
+                # The last incumbent holds the objective of the solution
+                _, objective, _ = progress.solutions[-1]
+                results[native] = (
+                    objective, len(solution["selected_venues"])
+                )
             
-            # Get expected travel time
-            travel_key = (
-                first_visit["venue"],
-                second_visit["venue"],
-                first_visit["end_time"],
-                day
+            cpmpy_objective, cpmpy_venues = results[False]
+            native_objective, native_venues = results[True]
+            assert native_objective == pytest.approx(cpmpy_objective), (
+                f"Objectives differ with weights {weights}"
             )
-            expected_travel = travel_times[travel_key]
-            
-            # Format error message
-            error_msg = (
-                f"On {day}, gap between venues ({actual_gap} min) is less "
-                f"than required travel time ({expected_travel} min)"
+            assert native_venues == cpmpy_venues, (
+                f"Venue counts differ with weights {weights}"
             )
-            assert actual_gap >= expected_travel, error_msg 
\ No newline at end of file
+
+
+class TestDataLoader:
+    def test_list_venues(
+        self,
+        data_loader: DataLoader,
+        dwell_times: Dict[str, float]
+    ):
+        """Test that the venue list matches the venues with dwell times."""
+        assert data_loader.list_venues() == list(dwell_times)
+    
+    def test_travel_time_array(
+        self,
+        data_dir: Path,
+        time_slots: List[str]
+    ):
+        """Test that the dense travel time array matches the dict."""
+        data_loader = DataLoader(data_dir)
+        _, _, travel_times, _, _ = data_loader.load_all(time_slots)
+        tt = data_loader.tt_array
+        assert tt is not None
+        
+        for (from_venue, to_venue, time_slot, day), minutes in travel_times.items():
+            assert tt[
+                data_loader.venue_idx[from_venue],
+                data_loader.venue_idx[to_venue],
+                data_loader.slot_idx[time_slot],
+                data_loader.day_idx[day]
+            ] == minutes
+        assert (tt != MISSING_TRAVEL_TIME).sum() == len(travel_times)
+        assert tt.dtype == np.int8
+    
+    def test_travel_time_matrix(
+        self,
+        travel_times: Dict[Tuple[str, str, str, DayOfWeek], int],
+        travel_time_matrix: TravelTimeMatrix
+    ):
+        """Test that the travel time matrix view matches the dict."""
+        venues = set(travel_time_matrix.venue_idx)
+        expected = {
+            key: minutes for key, minutes in travel_times.items()
+            if key[0] in venues and key[1] in venues
+        }
+        assert dict(travel_time_matrix) == expected
+        
+        key = next(iter(expected))
+        assert travel_time_matrix[key] == expected[key]
+        assert ("CN Tower", "CN Tower", key[2], key[3]) not in travel_time_matrix
+        assert ("Nowhere", key[1], key[2], key[3]) not in travel_time_matrix
+    
+    def test_venue_cache(
+        self,
+        data_dir: Path,
+        time_slots: List[str],
+        tmp_path: Path
+    ):
+        """Test that loading from the venue data cache matches the JSON."""
+        data_loader = DataLoader(data_dir, cache_dir=tmp_path)
+        assert data_loader.load_venue_cache() is None
+        expected = data_loader.load_all(time_slots, use_cache=True)
+        assert expected[0] is not None
+        crowd_array = data_loader.crowd_array
+        
+        # Building the cache leaves the arrays from load_all() in place
+        data_loader.build_venue_cache()
+        assert data_loader.crowd_array is crowd_array
+        cached = data_loader.load_all(time_slots, use_cache=True)
+        assert cached[0] is None
+        assert cached[1:] == expected[1:]
+    
+    def test_crowd_levels(
+        self,
+        data_dir: Path,
+        venue_data: Dict,
+        crowd_levels: Dict[Tuple[str, str, DayOfWeek], int]
+    ):
+        """Test that the crowd level array views match the dict."""
+        data_loader = DataLoader(data_dir)
+        venues = list(venue_data)
+        venue_idx = {venue: i for i, venue in enumerate(venues)}
+        for levels in (
+            data_loader.build_crowd_array(venue_data, venues),
+            data_loader.build_crowd_level_array(crowd_levels, venues)
+        ):
+            view = CrowdLevels(levels, venue_idx, dict(DAY_TO_INT))
+            assert dict(view) == crowd_levels
+            assert ("CN Tower", "09:30", "Monday") not in view
+            assert ("Nowhere", "09:00", "Monday") not in view
+
+
+class TestParetoAnalysis:
+    def test_identify_pareto_optimal_solutions(self):
+        """Test the Pareto front against the pairwise dominance check."""
+        metrics = [
+            (30, 2.0, 3), (30, 2.0, 3), (20, 3.0, 3), (40, 1.0, 4),
+            (40, 2.0, 4), (20, 3.0, 2), (50, 1.0, 4), (10, 4.0, 1)
+        ]
+        solutions = [
+            {
+                "metrics": {
+                    "total_travel_time_minutes": travel,
+                    "average_crowd_level": crowd,
+                    "total_venues": venues
+                }
+            }
+            for travel, crowd, venues in metrics
+        ]
+        
+        pareto = identify_pareto_optimal_solutions(solutions)
+        expected = [s for s in solutions if is_pareto_optimal(s, solutions)]
+        assert [id(s) for s in pareto] == [id(s) for s in expected]
+        assert len(pareto) == 5
+        
+        _, mask = identify_pareto_optimal_solutions(solutions, return_mask=True)
+        assert mask.tolist() == [
+            True, True, True, True, False, False, False, True
+        ]
+    
+    def test_add_to_frontier(self):
+        """Test the running frontier against the batch Pareto front."""
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            # Narrow ranges, so ties and duplicate solutions are common
+            metrics = [
+                (int(travel), float(crowd), int(venues))
+                for travel, crowd, venues in zip(
+                    rng.integers(0, 5, 30),
+                    rng.integers(0, 3, 30) / 2,
+                    rng.integers(1, 4, 30)
+                )
+            ]
+            solutions = [
+                {
+                    "metrics": {
+                        "total_travel_time_minutes": travel,
+                        "average_crowd_level": crowd,
+                        "total_venues": venues
+                    }
+                }
+                for travel, crowd, venues in metrics
+            ]
+            
+            frontier: List[Tuple[Tuple[float, ...], int]] = []
+            for i, (travel, crowd, venues) in enumerate(metrics):
+                row = (float(travel), crowd, float(-venues))
+                _add_to_frontier(frontier, row, i)
+            
+            expected = [
+                i for i, s in enumerate(solutions)
+                if is_pareto_optimal(s, solutions)
+            ]
+            assert sorted(j for _, j in frontier) == expected
+            pareto = identify_pareto_optimal_solutions(solutions)
+            assert [id(s) for s in pareto] == [
+                id(solutions[i]) for i in expected
+            ]